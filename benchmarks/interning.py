@@ -0,0 +1,72 @@
+""" Memory held per parsed log with and without sharing equal strings.
+
+Usage:
+    python benchmarks/interning.py [amount of logs]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from logmole import (  # noqa: E402
+    KeyValueType,
+    LogContainer,
+    StringPool,
+    TypeAssumptions
+)
+
+
+class HostContainer(LogContainer):
+    pattern = r"host:\s(?P<name>\S+)|version:\s(?P<version>\S+)"
+    representative = "host"
+
+
+class PluginsContainer(LogContainer):
+    pattern = r"loaded plugin\s(?P<plugins>\S+)"
+    representative = "plugins"
+
+
+class SettingsContainer(LogContainer):
+    pattern = r"setting\s(?P<settings>.*)"
+    assumptions = TypeAssumptions({".*": KeyValueType(r"(?P<key>\w+)=(?P<value>\w+)")})
+    representative = "render"
+
+
+class RenderLog(LogContainer):
+    sub_containers = [HostContainer, PluginsContainer, SettingsContainer]
+
+
+class PooledRenderLog(RenderLog):
+    string_pool = StringPool()
+
+
+LOG = "\n".join(
+    ["host: render-node-{0:02d}", "version: 7.1.2.0-release"] +
+    ["loaded plugin /opt/renderer/7.1.2/plugins/shader_library_{}.so".format(i) for i in range(8)] +
+    ["setting {}=on".format(name) for name in ("motion_blur", "depth_of_field", "adaptive_sampling", "subdivision")]
+)
+
+
+def measure(amount, container_cls):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [container_cls(LOG.format(i % 50)).compact() for i in range(amount)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(results) == amount
+    return (after - before) / float(amount)
+
+
+def main(amount):
+    print("{0:<24}{1:>16}".format("string pool", "bytes per log"))
+    for name, container_cls in (("None", RenderLog), ("StringPool", PooledRenderLog)):
+        print("{0:<24}{1:>16.0f}".format(name, measure(amount, container_cls)))
+    print(PooledRenderLog.string_pool.stats())
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
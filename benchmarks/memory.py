@@ -0,0 +1,83 @@
+""" Memory held per parsed log when keeping many results resident.
+
+Usage:
+    python benchmarks/memory.py [amount of logs]
+"""
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from logmole import LogContainer  # noqa: E402
+
+
+class HostContainer(LogContainer):
+    pattern = r"host:\s(?P<name>\S+)|version:\s(?P<version>\S+)"
+    representative = "host"
+
+
+class TimesContainer(LogContainer):
+    pattern = r"(?P<start>\d+:\d+:\d+).*started|(?P<end>\d+:\d+:\d+).*ends"
+    representative = "times"
+
+
+class MemoryContainer(LogContainer):
+    pattern = r"peak memory:\s(?P<peak>\d+)|textures:\s(?P<textures>\d+)"
+    representative = "memory"
+
+
+class StatsContainer(LogContainer):
+    sub_containers = [MemoryContainer]
+    pattern = r"samples:\s(?P<samples>\d+)|warnings:\s(?P<warnings>\d+)"
+    representative = "stats"
+
+
+class RenderLog(LogContainer):
+    sub_containers = [HostContainer, TimesContainer, StatsContainer]
+
+
+LOG = "\n".join([
+    "host: render-node-{0:04d}",
+    "version: 7.1.2",
+    "19:22:40 | render started",
+    "samples: {0}",
+    "warnings: 3",
+    "peak memory: {1}",
+    "textures: 128",
+    "19:24:10 | render ends",
+])
+
+
+def measure(amount, factory):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    results = [factory(LOG.format(i, i * 1024)) for i in range(amount)]
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    assert len(results) == amount
+    return (after - before) / float(amount)
+
+
+def with_tree(log):
+    container = RenderLog(log)
+    container._tree
+    return container
+
+
+def main(amount):
+    rows = [
+        ("LogContainer", RenderLog),
+        ("LogContainer + tree", with_tree),
+        ("CompactResult", lambda log: RenderLog(log).compact()),
+    ]
+    print("{0:<24}{1:>16}".format("representation", "bytes per log"))
+    for name, factory in rows:
+        print("{0:<24}{1:>16.0f}".format(name, measure(amount, factory)))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,113 @@
+""" Dump and load times and output sizes of the serialization formats.
+
+Usage:
+    python benchmarks/serialization.py [amount of logs]
+"""
+import io
+import json
+import os
+import random
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src"))
+
+from logmole import (  # noqa: E402
+    LogContainer,
+    TimeType,
+    TwoDimensionalNumberArrayType,
+    TypeAssumptions
+)
+from logmole.containers import json_default  # noqa: E402
+from logmole.serialization import (  # noqa: E402
+    iter_binary,
+    iter_ndjson,
+    write_binary,
+    write_json,
+    write_ndjson
+)
+
+
+class BoundsContainer(LogContainer):
+    pattern = r"bounds:\s(?P<bounds>.*)"
+    assumptions = TypeAssumptions({r"^\(": TwoDimensionalNumberArrayType(r"(?P<number>-?\d+\.\d+)", item_array_size=3)})
+    representative = "scene"
+
+
+class TimesContainer(LogContainer):
+    pattern = r"(?P<start>\d+:\d+:\d+) started|(?P<end>\d+:\d+:\d+) ends"
+    assumptions = TypeAssumptions({".*": TimeType()})
+    representative = "times"
+
+
+class SamplesContainer(LogContainer):
+    pattern = r"sample\s(?P<samples>\d+)"
+    representative = "stats"
+
+
+class RenderLog(LogContainer):
+    sub_containers = [BoundsContainer, TimesContainer, SamplesContainer]
+
+
+def create_log(rand):
+    bounds = " ".join("({:.4f}, {:.4f}, {:.4f})".format(*[rand.uniform(-100, 100) for _ in range(3)])
+                      for _ in range(2000))
+    lines = ["19:22:40 started", "bounds: " + bounds]
+    lines += ["sample {}".format(i) for i in rand.sample(range(100000), 2000)]
+    lines.append("19:24:10 ends")
+    return "\n".join(lines)
+
+
+def best(function, number=3):
+    return min(timeit.repeat(function, number=1, repeat=number)) * 1000
+
+
+def main(amount):
+    rand = random.Random(0)
+    results = [RenderLog(create_log(rand)) for _ in range(amount)]
+
+    # one json document per log
+    def dump_json_tree():
+        streams = [io.StringIO() for _ in results]
+        for result, stream in zip(results, streams):
+            json.dump(result._generate_member_tree(), stream, indent=4, sort_keys=True, default=json_default)
+        return streams
+
+    def dump_json_stream():
+        streams = [io.StringIO() for _ in results]
+        for result, stream in zip(results, streams):
+            write_json(result, stream, indent=4)
+        return streams
+
+    def dump_ndjson():
+        stream = io.StringIO()
+        write_ndjson(results, stream)
+        return stream
+
+    def dump_binary():
+        stream = io.BytesIO()
+        write_binary(results, stream)
+        return stream
+
+    json_data = [_.getvalue() for _ in dump_json_tree()]
+    assert json_data == [_.getvalue() for _ in dump_json_stream()]
+    json_size = sum(len(_) for _ in json_data)
+    ndjson_data = dump_ndjson().getvalue()
+    binary_data = dump_binary().getvalue()
+
+    print("{0} logs with 2000 xyz bounds and 2000 samples each".format(amount))
+    print("{0:<28}{1:>12}{2:>12}{3:>14}".format("format", "dump ms", "load ms", "size bytes"))
+    rows = [
+        ("json indent=4 (tree)", dump_json_tree, lambda: [json.loads(_) for _ in json_data], json_size),
+        ("json indent=4 (streamed)", dump_json_stream, lambda: [json.loads(_) for _ in json_data], json_size),
+        ("ndjson", dump_ndjson, lambda: list(iter_ndjson(io.StringIO(ndjson_data))), len(ndjson_data)),
+        ("binary", dump_binary, lambda: list(iter_binary(io.BytesIO(binary_data))), len(binary_data)),
+        ("binary as_array", dump_binary, lambda: list(iter_binary(io.BytesIO(binary_data), as_array=True)),
+         len(binary_data)),
+    ]
+    for name, dump, load, size in rows:
+        print("{0:<28}{1:>12.1f}{2:>12.1f}{3:>14}".format(name, best(dump), best(load), size))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
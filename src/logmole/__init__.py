@@ -1,4 +1,12 @@
+from .aggregation import Aggregator
+from .composite import CompositeParser
 from .containers import LogContainer
+from .index import LogIndex
+from .interning import (
+    GLOBAL_STRING_POOL,
+    StringPool
+)
+from .ranges import Region
 from .types import (
     GenericAssumptions,
     TypeAssumptions,
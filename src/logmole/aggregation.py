@@ -0,0 +1,432 @@
+import datetime
+import hashlib
+import math
+
+from .compact import compact_schema
+
+
+class QuantileSketch(object):
+    """ mergeable sketch estimating quantiles with a bounded relative error
+
+    Values are counted in logarithmically sized buckets, so each estimated quantile is within
+    `relative_accuracy` of the real value. If the amount of buckets exceeds `max_buckets` the
+    buckets closest to zero get collapsed, which keeps the memory bounded while preserving the
+    accuracy of the higher quantiles.
+
+    Keyword Args:
+        relative_accuracy (float): relative error of the estimated quantiles
+        max_buckets (int): maximum amount of buckets per sign
+
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("Relative accuracy has to be between 0 and 1, got {}.".format(relative_accuracy))
+        self._relative_accuracy = relative_accuracy
+        self._max_buckets = max_buckets
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive = {}
+        self._negative = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def _index(self, value):
+        return int(math.ceil(math.log(value) / self._log_gamma))
+
+    def _value(self, index):
+        return 2 * self._gamma ** index / (self._gamma + 1)
+
+    def _collapse(self, buckets):
+        if len(buckets) > self._max_buckets:
+            indices = sorted(buckets)
+            collapsed = indices[:len(indices) - self._max_buckets + 1]
+            buckets[collapsed[-1]] += sum(buckets.pop(_) for _ in collapsed[:-1])
+
+    def add(self, value, count=1):
+        """ adds a value
+
+        Args:
+            value (float): value to add
+        Keyword Args:
+            count (int): amount of times the value was observed
+
+        Returns:
+
+        """
+        if value > 0:
+            index = self._index(value)
+            self._positive[index] = self._positive.get(index, 0) + count
+            self._collapse(self._positive)
+        elif value < 0:
+            index = self._index(-value)
+            self._negative[index] = self._negative.get(index, 0) + count
+            self._collapse(self._negative)
+        else:
+            self._zero_count += count
+        self.count += count
+
+    def merge(self, other):
+        """ adds all values of another sketch
+
+        Args:
+            other (QuantileSketch): sketch using the same relative accuracy
+
+        Returns:
+
+        """
+        if other._gamma != self._gamma:
+            raise ValueError("Can only merge sketches of the same relative accuracy.")
+        for buckets, other_buckets in ((self._positive, other._positive), (self._negative, other._negative)):
+            for index, count in other_buckets.items():
+                buckets[index] = buckets.get(index, 0) + count
+            self._collapse(buckets)
+        self._zero_count += other._zero_count
+        self.count += other.count
+
+    def quantile(self, q):
+        """ estimates a quantile
+
+        Args:
+            q (float): quantile between 0 and 1
+
+        Returns:
+            float: estimated value or None if no values were added
+
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile has to be between 0 and 1, got {}.".format(q))
+        if not self.count:
+            return None
+
+        rank = q * (self.count - 1)
+        seen = 0
+        for index in sorted(self._negative, reverse=True):
+            seen += self._negative[index]
+            if seen > rank:
+                return -self._value(index)
+        seen += self._zero_count
+        if seen > rank:
+            return 0.0
+        for index in sorted(self._positive):
+            seen += self._positive[index]
+            if seen > rank:
+                return self._value(index)
+
+
+class DistinctCounter(object):
+    """ mergeable HyperLogLog estimating the amount of distinct values
+
+    Values get hashed using their repr, so the estimation is stable between processes.
+
+    Keyword Args:
+        precision (int): amount of index bits, uses 2 ** precision bytes of memory
+
+    """
+
+    def __init__(self, precision=12):
+        if not 4 <= precision <= 16:
+            raise ValueError("Precision has to be between 4 and 16, got {}.".format(precision))
+        self._precision = precision
+        self._registers = bytearray(1 << precision)
+
+    def add(self, value):
+        """ adds a value
+
+        Args:
+            value (undefined): value to count
+
+        Returns:
+
+        """
+        digest = hashlib.blake2b(repr(value).encode("utf-8"), digest_size=8).digest()
+        hashed = int.from_bytes(digest, "big")
+        index = hashed >> (64 - self._precision)
+        remaining_bits = 64 - self._precision
+        remaining = hashed & ((1 << remaining_bits) - 1)
+        rank = remaining_bits - remaining.bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def merge(self, other):
+        """ adds all values of another counter
+
+        Args:
+            other (DistinctCounter): counter using the same precision
+
+        Returns:
+
+        """
+        if other._precision != self._precision:
+            raise ValueError("Can only merge counters of the same precision.")
+        self._registers = bytearray(max(_) for _ in zip(self._registers, other._registers))
+
+    def estimate(self):
+        """ estimated amount of distinct values
+
+        Returns:
+            int: estimated amount
+
+        """
+        m = len(self._registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -_ for _ in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # linear counting is more precise for small cardinalities
+            estimate = m * math.log(float(m) / zeros)
+        return int(round(estimate))
+
+
+def _numeric(value):
+    """ numeric representation of a value used for the statistics
+
+    Args:
+        value (undefined): member value
+
+    Returns:
+        float: number or None if the value isn't numeric
+
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        value = float(value)
+        return value if not (math.isnan(value) or math.isinf(value)) else None
+    if isinstance(value, datetime.time):
+        return value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1e6
+    return None
+
+
+class MemberStatistics(object):
+    """ incrementally updated statistics of a single member
+
+    Keeps count, min, max, mean and variance of numeric values, a quantile sketch and a
+    distinct counter. datetime.time values are treated as seconds. Multiple matches of a
+    member are added individually.
+
+    Keyword Args:
+        relative_accuracy (float): relative error of the estimated quantiles
+        max_buckets (int): maximum amount of quantile sketch buckets per sign
+        precision (int): precision of the distinct counter
+
+    """
+
+    def __init__(self, relative_accuracy=0.01, max_buckets=2048, precision=12):
+        self.count = 0
+        self.numeric_count = 0
+        self.min = None
+        self.max = None
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.sketch = QuantileSketch(relative_accuracy=relative_accuracy, max_buckets=max_buckets)
+        self.distinct = DistinctCounter(precision=precision)
+
+    @property
+    def variance(self):
+        if self.numeric_count < 2:
+            return None
+        return self._m2 / (self.numeric_count - 1)
+
+    @property
+    def stddev(self):
+        variance = self.variance
+        return None if variance is None else math.sqrt(variance)
+
+    def update(self, value):
+        """ adds a member value
+
+        Args:
+            value (undefined): member value, lists are added item by item and None is ignored
+
+        Returns:
+
+        """
+        if value is None:
+            return
+        if isinstance(value, list):
+            for _ in value:
+                self.update(_)
+            return
+
+        self.count += 1
+        self.distinct.add(value)
+
+        number = _numeric(value)
+        if number is None:
+            return
+        self.numeric_count += 1
+        self.min = number if self.min is None else min(self.min, number)
+        self.max = number if self.max is None else max(self.max, number)
+        delta = number - self.mean
+        self.mean += delta / self.numeric_count
+        self._m2 += delta * (number - self.mean)
+        self.sketch.add(number)
+
+    def merge(self, other):
+        """ adds the statistics of another member
+
+        Args:
+            other (MemberStatistics): statistics of the same member collected elsewhere
+
+        Returns:
+
+        """
+        if other.numeric_count:
+            if self.numeric_count:
+                count = self.numeric_count + other.numeric_count
+                delta = other.mean - self.mean
+                self._m2 += other._m2 + delta * delta * self.numeric_count * other.numeric_count / count
+                self.mean += delta * other.numeric_count / count
+                self.min = min(self.min, other.min)
+                self.max = max(self.max, other.max)
+            else:
+                self.mean, self._m2, self.min, self.max = other.mean, other._m2, other.min, other.max
+            self.numeric_count += other.numeric_count
+        self.count += other.count
+        self.sketch.merge(other.sketch)
+        self.distinct.merge(other.distinct)
+
+    def quantile(self, q):
+        """ estimated quantile of the numeric values
+
+        Args:
+            q (float): quantile between 0 and 1
+
+        Returns:
+            float: estimated value or None if there are no numeric values
+
+        """
+        return self.sketch.quantile(q)
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99)):
+        """ summarized statistics
+
+        Keyword Args:
+            quantiles (tuple): quantiles to estimate
+
+        Returns:
+            dict: count, numeric_count, min, max, mean, stddev, distinct and the estimated quantiles
+
+        """
+        summary = {
+            "count": self.count,
+            "numeric_count": self.numeric_count,
+            "min": self.min,
+            "max": self.max,
+            "mean": self.mean if self.numeric_count else None,
+            "stddev": self.stddev,
+            "distinct": self.distinct.estimate()
+        }
+        for q in quantiles:
+            summary["p{:g}".format(q * 100)] = self.quantile(q)
+        return summary
+
+
+class Aggregator(object):
+    """ incrementally aggregates member statistics across many logs
+
+    Parsed results are only needed while they are added, so memory stays bounded no matter how
+    many logs get aggregated. Aggregators of parallel workers can be pickled and merged.
+
+    Args:
+        container_cls (type): LogContainer subclass that describes the logs
+    Keyword Args:
+        members (list): dot separated names of the members to aggregate, all if None
+        relative_accuracy (float): relative error of the estimated quantiles
+        max_buckets (int): maximum amount of quantile sketch buckets per sign
+        precision (int): precision of the distinct counters
+
+    Examples:
+        >>> aggregator = Aggregator(RenderLog, members=["stats.render_time", "stats.peak_memory"])
+        >>> aggregator.update_many(paths)
+        >>> print(aggregator["stats.peak_memory"].quantile(0.99))
+
+    """
+
+    def __init__(self, container_cls, members=None, relative_accuracy=0.01, max_buckets=2048, precision=12):
+        member_names = compact_schema(container_cls).member_names
+        if members is None:
+            members = member_names
+        unknown = set(members) - set(member_names)
+        if unknown:
+            raise ValueError("Container '{0}' has no members {1}.".format(container_cls.__name__, sorted(unknown)))
+
+        self._container_cls = container_cls
+        self._statistics = {
+            member_name: MemberStatistics(relative_accuracy=relative_accuracy, max_buckets=max_buckets,
+                                          precision=precision)
+            for member_name in members
+        }
+        self.logs = 0
+
+    def __getitem__(self, member_name):
+        return self._statistics[member_name]
+
+    @property
+    def members(self):
+        """ names of the aggregated members
+
+        Returns:
+            list: dot separated member names
+
+        """
+        return sorted(self._statistics)
+
+    def update(self, result):
+        """ adds the members of a parsed log
+
+        Args:
+            result (LogContainer): parsed container or its CompactResult
+
+        Returns:
+
+        """
+        statistics = self._statistics
+        for member_name, value in result._iter_members():
+            if member_name in statistics:
+                statistics[member_name].update(value)
+        self.logs += 1
+
+    def update_many(self, sources):
+        """ parses and adds many logs, each result gets released once it is added
+
+        Args:
+            sources (iterable): sources the container supports, e.g. paths, log contents or file
+                                objects, or already parsed results
+
+        Returns:
+
+        """
+        for source in sources:
+            if not hasattr(source, "_iter_members"):
+                source = self._container_cls(source)
+            self.update(source)
+
+    def merge(self, other):
+        """ adds the statistics of another aggregator, e.g. one of a parallel worker
+
+        Args:
+            other (Aggregator): aggregator of the same container and members
+
+        Returns:
+
+        """
+        if other._container_cls is not self._container_cls or set(other._statistics) != set(self._statistics):
+            raise ValueError("Can only merge aggregators of the same container and members.")
+        for member_name, statistics in self._statistics.items():
+            statistics.merge(other._statistics[member_name])
+        self.logs += other.logs
+
+    def summary(self, quantiles=(0.5, 0.9, 0.99)):
+        """ summarized statistics of all members
+
+        Keyword Args:
+            quantiles (tuple): quantiles to estimate
+
+        Returns:
+            dict: {member name: summary}
+
+        """
+        return {member_name: self._statistics[member_name].summary(quantiles=quantiles)
+                for member_name in self.members}
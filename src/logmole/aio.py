@@ -0,0 +1,265 @@
+import asyncio
+import codecs
+import io
+import os
+import re
+
+from .utilities import is_content
+
+DEFAULT_CHUNK_SIZE = 1 << 16
+DEFAULT_CONCURRENCY = 4
+
+
+async def _iter_chunks(source, chunk_size):
+    """ reads a source chunk by chunk without blocking the event loop
+
+    Args:
+        source (undefined): path, log content, stream reader or async iterable of bytes or str
+        chunk_size (int): amount of bytes or characters to request per read
+
+    Yields:
+        bytes or str: raw chunks
+
+    """
+    loop = asyncio.get_running_loop()
+
+    if isinstance(source, (str, os.PathLike)):
+        if isinstance(source, str) and is_content(source) or not os.path.exists(source):
+            # same as LogContainer we consider a non existing path as the log content itself
+            yield source
+            return
+
+        f = await loop.run_in_executor(None, open, source, "rb")
+        try:
+            while True:
+                chunk = await loop.run_in_executor(None, f.read, chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+        finally:
+            f.close()
+
+    elif hasattr(source, "read"):
+        while True:
+            chunk = await source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    elif hasattr(source, "__aiter__"):
+        async for chunk in source:
+            yield chunk
+
+    else:
+        raise TypeError("Unsupported source '{}'. ".format(source) +
+                        "Expected a path, a string, a stream reader or an async iterable.")
+
+
+async def _iter_line_batches(source, chunk_size, encoding):
+    """ splits the chunks of a source into lines
+
+    Lines are terminated the same way as when iterating over a file opened in text mode, so
+    '\\r\\n' and '\\r' get translated to '\\n'. Lines spanning multiple chunks will be joined.
+
+    Args:
+        source (undefined): path, log content, stream reader or async iterable of bytes or str
+        chunk_size (int): amount of bytes or characters to request per read
+        encoding (str): encoding used to decode bytes chunks
+
+    Yields:
+        list: lines of each chunk
+
+    """
+    decoder = None
+    empty = None
+    remainder = ""
+
+    async for chunk in _iter_chunks(source, chunk_size):
+        if decoder is None:
+            empty = chunk[:0]
+            decoder = io.IncrementalNewlineDecoder(
+                None if isinstance(chunk, str) else codecs.getincrementaldecoder(encoding)(),
+                translate=True
+            )
+        lines = (remainder + decoder.decode(chunk)).split("\n")
+        remainder = lines.pop()
+        if lines:
+            yield [line + "\n" for line in lines]
+
+    if decoder is not None:
+        # flush a pending carriage return or incomplete multibyte sequence
+        lines = (remainder + decoder.decode(empty, final=True)).split("\n")
+        remainder = lines.pop()
+        lines = [line + "\n" for line in lines]
+        if remainder:
+            lines.append(remainder)
+        if lines:
+            yield lines
+
+
+def _match_lines(pattern, lines):
+    """ matches a batch of lines, runs in the executor and may run in another process
+
+    Args:
+        pattern (str): global regex pattern of a container
+        lines (list): lines to match
+
+    Returns:
+        list: (namespaced name of the capturing group, matched value) tuples of each matched line
+
+    """
+    finditer = re.compile(pattern).finditer
+    matched = []
+    for line in lines:
+        groups = [(key, value) for match in finditer(line) for key, value in match.groupdict().items() if value]
+        if groups:
+            matched.append(groups)
+    return matched
+
+
+def _match_window(window, lines, final=False):
+    """ matches the multiline patterns of a batch of lines, runs in the executor and may run in another process
+
+    The window is returned, so its buffered lines and state can be continued by the next batch.
+
+    Args:
+        window (LineWindow): window of the multiline patterns
+        lines (list): lines to match
+    Keyword Args:
+        final (bool): if True the buffered lines get matched as well, since no further lines will follow
+
+    Returns:
+        tuple: (window, (namespaced name of the capturing group, matched value) tuples of each match)
+
+    """
+    matched = []
+    found = []
+    for line in lines:
+        found.extend(window.push(line))
+    if final:
+        found.extend(window.flush())
+    for _, match in found:
+        groups = [(key, value) for key, value in match.groupdict().items() if value]
+        if groups:
+            matched.append(groups)
+    return window, matched
+
+
+async def aparse(container_cls, source, executor=None, chunk_size=None, encoding="utf-8"):
+    """ parses a single source without blocking the event loop
+
+    The source is read chunk by chunk while the matching of already read lines gets offloaded
+    to the given executor. Reading of the next chunk and matching of the previous one overlap.
+    The executor only receives the regex pattern, the window of the multiline patterns and the
+    lines and returns the matched values, so a ProcessPoolExecutor can be used to match in
+    parallel. Converting and adding the matched values happens in the event loop.
+
+    Args:
+        container_cls (type): LogContainer subclass that describes the log
+        source (undefined): path, log content, stream reader or async iterable of bytes or str
+    Keyword Args:
+        executor (concurrent.futures.Executor): executor that runs the matching, default executor if None
+        chunk_size (int): amount of bytes or characters to request per read
+        encoding (str): encoding used to decode bytes chunks
+
+    Returns:
+        LogContainer: parsed container
+
+    """
+    loop = asyncio.get_running_loop()
+    container = container_cls._new()
+    pattern = container.regex
+    window = container._line_window()
+
+    async def store(futures):
+        nonlocal window
+        lines_future, window_future = futures
+        if lines_future is not None:
+            for groups in await lines_future:
+                container._store_groups(groups)
+        if window_future is not None:
+            window, matched = await window_future
+            for groups in matched:
+                container._store_groups(groups)
+
+    pending = None
+    async for lines in _iter_line_batches(source, chunk_size or DEFAULT_CHUNK_SIZE, encoding):
+        # values get added sequentially, so only one batch per container is matched at a time
+        if pending is not None:
+            await store(pending)
+        pending = (
+            loop.run_in_executor(executor, _match_lines, pattern, lines) if pattern else None,
+            loop.run_in_executor(executor, _match_window, window, lines) if window is not None else None
+        )
+    if pending is not None:
+        await store(pending)
+    if window is not None:
+        # match the lines still buffered by the window
+        await store((None, loop.run_in_executor(executor, _match_window, window, [], True)))
+
+    return container
+
+
+async def aparse_many(container_cls, sources, executor=None, concurrency=None, chunk_size=None,
+                      encoding="utf-8"):
+    """ parses many sources concurrently without blocking the event loop
+
+    At most `concurrency` sources are in flight at any time. New sources will only be taken
+    from `sources` once the consumer requested further results, which provides backpressure.
+
+    Args:
+        container_cls (type): LogContainer subclass that describes the logs
+        sources (iterable): iterable or async iterable of sources :func:`aparse` supports
+    Keyword Args:
+        executor (concurrent.futures.Executor): executor that runs the matching, default executor if None
+        concurrency (int): maximum number of sources parsed at once
+        chunk_size (int): amount of bytes or characters to request per read
+        encoding (str): encoding used to decode bytes chunks
+
+    Yields:
+        tuple: (source, container) in order of completion
+
+    """
+    concurrency = DEFAULT_CONCURRENCY if concurrency is None else concurrency
+    if concurrency < 1:
+        raise ValueError("Concurrency needs to be at least 1, got {}.".format(concurrency))
+
+    exhausted = object()
+    if hasattr(sources, "__aiter__"):
+        source_iterator = sources.__aiter__()
+
+        async def next_source():
+            try:
+                return await source_iterator.__anext__()
+            except StopAsyncIteration:
+                return exhausted
+    else:
+        source_iterator = iter(sources)
+
+        async def next_source():
+            return next(source_iterator, exhausted)
+
+    pending = {}
+    has_sources = True
+    try:
+        while True:
+            while has_sources and len(pending) < concurrency:
+                source = await next_source()
+                if source is exhausted:
+                    has_sources = False
+                    break
+                task = asyncio.ensure_future(
+                    aparse(container_cls, source, executor=executor, chunk_size=chunk_size, encoding=encoding)
+                )
+                pending[task] = source
+
+            if not pending:
+                break
+
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                source = pending.pop(task)
+                yield source, task.result()
+    finally:
+        for task in pending:
+            task.cancel()
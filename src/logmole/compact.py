@@ -0,0 +1,168 @@
+import json
+import threading
+
+from .containers import json_default
+from .utilities import member_tree
+
+_SCHEMAS = {}
+_SCHEMAS_LOCK = threading.Lock()
+
+
+class CompactNode(object):
+    """ slotted view on the flat value array of a result
+
+    Node classes are generated once per container and shared by all of its results.
+    Accessing a nested representative creates a lightweight view on the same value array.
+    """
+    __slots__ = ("_values", )
+
+    def __init__(self, values):
+        self._values = values
+
+
+def _leaf_property(member_id):
+    return property(lambda self: self._values[member_id])
+
+
+def _node_property(node_cls):
+    return property(lambda self: node_cls(self._values))
+
+
+class CompactSchema(object):
+    """ member ids and the shared slotted classes of a container
+
+    Args:
+        container_cls (type): LogContainer subclass
+
+    """
+    __slots__ = ("container_cls", "member_names", "member_ids", "result_cls")
+
+    def __init__(self, container_cls):
+        self.container_cls = container_cls
+        self.member_names = tuple(sorted(_["member_name"] for _ in container_cls._new()._groups_map.values()))
+        self.member_ids = {member_name: i for i, member_name in enumerate(self.member_names)}
+
+        # group all members by their parent node
+        nodes = {"": {}}
+        for member_id, member_name in enumerate(self.member_names):
+            parts = member_name.split(".")
+            for i in range(1, len(parts)):
+                nodes.setdefault(".".join(parts[:i]), {})
+            nodes[".".join(parts[:-1])][parts[-1]] = member_id
+
+        # generate the deepest nodes first, so parents can refer to their children
+        node_classes = {}
+        for path in sorted(nodes, key=lambda _: -_.count(".") if _ else 1):
+            attributes = {"__slots__": ()}
+            for attr, member_id in nodes[path].items():
+                attributes[attr] = _leaf_property(member_id)
+            for child_path, child_cls in node_classes.items():
+                parent_path, _, attr = child_path.rpartition(".")
+                if parent_path == path and attr not in attributes:
+                    attributes[attr] = _node_property(child_cls)
+
+            if path:
+                node_classes[path] = type(str(container_cls.__name__ + "_" + path.replace(".", "_")),
+                                          (CompactNode, ), attributes)
+            else:
+                attributes["_schema"] = self
+                self.result_cls = type(str("Compact" + container_cls.__name__), (CompactResult, ), attributes)
+
+
+def compact_schema(container_cls):
+    """ shared compact schema of a container
+
+    Args:
+        container_cls (type): LogContainer subclass
+
+    Returns:
+        CompactSchema: schema that is created once per container
+
+    """
+    schema = _SCHEMAS.get(container_cls)
+    if schema is None:
+        with _SCHEMAS_LOCK:
+            schema = _SCHEMAS.get(container_cls)
+            if schema is None:
+                schema = _SCHEMAS[container_cls] = CompactSchema(container_cls)
+    return schema
+
+
+def _restore(container_cls, values):
+    return compact_schema(container_cls).result_cls(values)
+
+
+class CompactResult(CompactNode):
+    """ memory efficient representation of a parsed LogContainer
+
+    All values are stored in a single flat list indexed by member id. Members can be accessed
+    like on the LogContainer itself, but the slotted classes providing this access are shared
+    by all results of the same container. The member tree is only created if requested.
+
+    Examples:
+        >>> log = MovieLog("/tmp/some.log").compact()
+        >>> print(log.times.start)
+        19:22:40
+
+    """
+    __slots__ = ()
+
+    _schema = None
+
+    def __repr__(self):
+        return "{}".format(json.dumps(self.to_tree(), indent=4, default=json_default))
+
+    def __reduce__(self):
+        return _restore, (self._schema.container_cls, self._values)
+
+    @classmethod
+    def from_container(cls, container):
+        """ creates the compact representation of a parsed container
+
+        Args:
+            container (LogContainer): parsed container
+
+        Returns:
+            CompactResult: compact result
+
+        """
+        schema = compact_schema(container.__class__)
+        values = [None] * len(schema.member_names)
+        for member_name, value in container._iter_members():
+            values[schema.member_ids[member_name]] = value
+        return schema.result_cls(values)
+
+    def _iter_members(self):
+        """ iterates over all members
+
+        Yields:
+            tuple: (member name, value)
+
+        """
+        return zip(self._schema.member_names, self._values)
+
+    def get_value(self, member_name, default=None):
+        """ get the value of nested members using a dot separated strings
+
+        Args:
+            member_name (str): dot separated member name
+        Keyword Args:
+            default (undefined): value if there is no such member
+
+        Returns:
+            undefined: member value
+
+        """
+        member_id = self._schema.member_ids.get(member_name)
+        if member_id is None:
+            return default
+        return self._values[member_id]
+
+    def to_tree(self):
+        """ creates the member tree the same way the LogContainer represents it
+
+        Returns:
+            dict: members representation
+
+        """
+        return member_tree(self._iter_members())
@@ -0,0 +1,124 @@
+import re
+
+from .utilities import iter_lines
+
+
+class CompositeParser(object):
+    """ parses a log once for multiple independent containers
+
+    All container patterns get merged into one namespaced regex that is used as a prefilter,
+    so the file only gets read once and lines no container is interested in are rejected
+    with a single scan instead of one scan per container.
+    Lines passing the prefilter get matched by each container individually. This keeps the
+    results exactly the same as if each container would have parsed the log on its own, since
+    a match of one container in the merged regex can hide an overlapping match of another one.
+    So a passing line costs one scan more than parsing separately, and the speedup only shows
+    on logs where most lines don't match any container. On logs where most lines match, the
+    time is spent converting and adding the values, which is the same work as parsing the log
+    with each container on its own.
+    Multiline patterns aren't part of the prefilter, their windows get fed with every line.
+
+    Args:
+        *containers (type): LogContainer subclasses
+
+    Examples:
+        >>> parser = CompositeParser(StatsLog, WarningsLog)
+        >>> stats, warnings = parser.parse("/tmp/some.log")
+
+    """
+    _named_group_filter = re.compile(r"\(\?P<(\w+)>")
+    _backreference_filter = re.compile(r"\(\?P=(\w+)\)")
+
+    def __init__(self, *containers):
+        if not containers:
+            raise ValueError("{} needs at least one container.".format(self.__class__.__name__))
+
+        self._containers = containers
+        self._regexes = []
+
+        patterns = []
+        for i, container in enumerate(containers):
+            pattern = container._new().regex
+            self._regexes.append(re.compile(pattern) if pattern else None)
+            if pattern:
+                patterns.append(self._namespace_pattern(pattern, self._schema_prefix(i)))
+
+        self._prefilter = re.compile("|".join(patterns)) if patterns else None
+
+    @property
+    def containers(self):
+        """ container classes in the order the results will be returned
+
+        Returns:
+            tuple: LogContainer subclasses
+
+        """
+        return self._containers
+
+    @property
+    def regex(self):
+        """ merged regex pattern of all containers
+
+        Returns:
+            str: regex pattern
+
+        """
+        return self._prefilter.pattern if self._prefilter else ""
+
+    @staticmethod
+    def _schema_prefix(index):
+        """ named capturing group prefix of the container at the given index
+
+        Args:
+            index (int): index of the container
+
+        Returns:
+            str: named capturing prefix
+
+        """
+        return "s{}_".format(index)
+
+    def _namespace_pattern(self, pattern, prefix):
+        """ prefixes all named capturing groups and their backreferences to avoid conflicts
+
+        Args:
+            pattern (str): regex pattern
+            prefix (str): named capturing prefix
+
+        Returns:
+            str: namespaced regex pattern
+
+        """
+        pattern = self._named_group_filter.sub(lambda m: "(?P<{0}{1}>".format(prefix, m.group(1)), pattern)
+        return self._backreference_filter.sub(lambda m: "(?P={0}{1})".format(prefix, m.group(1)), pattern)
+
+    def parse(self, file):
+        """ parses a file or string data for all containers at once
+
+        Args:
+            file (str): path to a file or the log content
+
+        Returns:
+            list: one parsed LogContainer per container in the given order
+
+        """
+        results = [container._new() for container in self._containers]
+        active = [(result, regex) for result, regex in zip(results, self._regexes) if regex]
+
+        # multiline patterns need to see every line, the prefilter only applies to single line patterns
+        windows = [(result, result._line_window()) for result in results]
+        windows = [(result, window) for result, window in windows if window is not None]
+
+        if self._prefilter is not None or windows:
+            prefilter = self._prefilter.search if self._prefilter is not None else None
+            for line in iter_lines(file):
+                for result, window in windows:
+                    result._store_matches(match for _, match in window.push(line))
+                if prefilter is None or prefilter(line) is None:
+                    continue
+                for result, regex in active:
+                    result._store_matches(regex.finditer(line))
+            for result, window in windows:
+                result._store_matches(match for _, match in window.flush())
+
+        return results
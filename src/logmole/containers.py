@@ -1,4 +1,3 @@
-import os
 import logging
 import json
 import re
@@ -6,10 +5,19 @@ import re
 
 from collections import OrderedDict
 
+from .multiline import LineWindow
 from .types import (
     GenericAssumptions,
     TypeAssumptions
 )
+from .utilities import (
+    iter_bytes_lines,
+    iter_file_lines,
+    iter_lines,
+    iter_path_lines,
+    iter_string_lines,
+    member_tree
+)
 
 LOG = logging.getLogger("logmole.container")
 
@@ -21,23 +29,179 @@ class LogContainer(object):
     pattern = ""
     infer_type = True
     assumptions = GenericAssumptions()
+    string_pool = None
+    span = 1
     _regex = ""
+    _container_patterns = ()
+    _multiline_patterns = ()
     _named_group_filter = re.compile("\?P<(\w*)>")
 
     def __init__(self, file):
+        self._initialize()
+        self._parse_data(iter_lines(file))
+
+    def __repr__(self):
+        return "{}".format(json.dumps(self._tree, indent=4, default=json_default))
+
+    def _initialize(self):
+        """ prepares the regex chain and the members mapping before any data gets parsed """
         self._groups_map = {}
         self._generate_chain(self.sub_containers, self, init=True)
 
-        if os.path.exists(file):
-            with open(file) as f:
-                self._parse_data(f)
-        else:
-            self._parse_data(file.splitlines())
+    @classmethod
+    def _new(cls):
+        """ creates an initialized container instance that didn't parse any data yet
 
-        self._tree = self._generate_member_tree()
+        Returns:
+            LogContainer: container without parsed data
 
-    def __repr__(self):
-        return "{}".format(json.dumps(self._tree, indent=4, default=str))
+        """
+        container = cls.__new__(cls)
+        container._initialize()
+        return container
+
+    @classmethod
+    def from_lines(cls, lines):
+        """ parses an iterable of lines, which gets consumed lazily
+
+        Args:
+            lines (iterable): lines of the log
+
+        Returns:
+            LogContainer: parsed container
+
+        """
+        container = cls._new()
+        container._parse_data(lines)
+        return container
+
+    @classmethod
+    def from_path(cls, path, encoding=None):
+        """ parses a file without checking if the argument could be log content
+
+        Args:
+            path (str): path to the log
+        Keyword Args:
+            encoding (str): encoding of the log, the platform default if None
+
+        Returns:
+            LogContainer: parsed container
+
+        """
+        return cls.from_lines(iter_path_lines(path, encoding=encoding))
+
+    @classmethod
+    def from_string(cls, string):
+        """ parses log content without any filesystem lookup
+
+        Lines get split lazily chunk by chunk instead of splitting the whole string at once.
+
+        Args:
+            string (str): log content
+
+        Returns:
+            LogContainer: parsed container
+
+        """
+        return cls.from_lines(iter_string_lines(string))
+
+    @classmethod
+    def from_bytes(cls, data, encoding="utf-8"):
+        """ parses encoded log content, chunks of lines get decoded lazily from a memoryview
+
+        Args:
+            data (bytes): log content, any bytes-like object is supported
+        Keyword Args:
+            encoding (str): encoding of the log
+
+        Returns:
+            LogContainer: parsed container
+
+        """
+        return cls.from_lines(iter_bytes_lines(data, encoding=encoding))
+
+    @classmethod
+    def from_file(cls, f, encoding="utf-8"):
+        """ parses an open file object line by line
+
+        Args:
+            f (file): text or binary file object
+        Keyword Args:
+            encoding (str): encoding used to decode the lines of binary file objects
+
+        Returns:
+            LogContainer: parsed container
+
+        """
+        return cls.from_lines(iter_file_lines(f, encoding=encoding))
+
+    @classmethod
+    def aparse(cls, source, executor=None, chunk_size=None, encoding="utf-8"):
+        """ asynchronously parses a single source, see :func:`logmole.aio.aparse`
+
+        Returns:
+            coroutine: resolves to the parsed container
+
+        """
+        from . import aio
+        return aio.aparse(cls, source, executor=executor, chunk_size=chunk_size, encoding=encoding)
+
+    @classmethod
+    def aparse_many(cls, sources, executor=None, concurrency=None, chunk_size=None, encoding="utf-8"):
+        """ asynchronously parses many sources, see :func:`logmole.aio.aparse_many`
+
+        Returns:
+            async_generator: yields (source, container) tuples in order of completion
+
+        """
+        from . import aio
+        return aio.aparse_many(cls, sources, executor=executor, concurrency=concurrency,
+                               chunk_size=chunk_size, encoding=encoding)
+
+    @classmethod
+    def parse_range(cls, file, start=0, end=None, containers=None, encoding="utf-8"):
+        """ parses a byte range of a file, see :func:`logmole.ranges.parse_regions`
+
+        Returns:
+            LogContainer: container holding the matches of the range
+
+        """
+        from .ranges import Region, parse_regions
+        return parse_regions(cls, file, [Region(start, end, containers=containers)], encoding=encoding)
+
+    @classmethod
+    def parse_regions(cls, file, regions, encoding="utf-8"):
+        """ parses multiple regions of a file, see :func:`logmole.ranges.parse_regions`
+
+        Returns:
+            LogContainer: container holding the matches of all regions
+
+        """
+        from .ranges import parse_regions
+        return parse_regions(cls, file, regions, encoding=encoding)
+
+    @property
+    def _tree(self):
+        """ member tree, generated once it gets requested
+
+        Returns:
+            dict: members representation
+
+        """
+        tree = self.__dict__.get("_member_tree")
+        if tree is None:
+            tree = self._member_tree = self._generate_member_tree()
+        return tree
+
+    def _iter_members(self):
+        """ iterates over all added members
+
+        Yields:
+            tuple: (member name, value)
+
+        """
+        for value in self._groups_map.values():
+            yield value["member_name"], getattr(value["obj"], value["attr"])
 
     def _generate_member_tree(self):
         """ recreate a sorted tree structure that represents all added members
@@ -46,22 +210,17 @@ class LogContainer(object):
             dict: members representation
 
         """
-        tree = OrderedDict()
-
-        # sort all added members
-        members = [_["member_name"] for _ in self._groups_map.values()]
-        members.sort()
-
-        # create a nested dictionary representing all added members
-        for item in members:
-            t = tree
-            parts = item.split(".")
-            for i, part in enumerate(parts):
-                if (i + 1) == len(parts):
-                    t = t.setdefault(part, self.get_value(item))
-                else:
-                    t = t.setdefault(part, {})
-        return tree
+        return member_tree(self._iter_members())
+
+    def compact(self):
+        """ compact representation of the parsed members, see :class:`logmole.compact.CompactResult`
+
+        Returns:
+            CompactResult: slotted result sharing its classes with all results of the same container
+
+        """
+        from .compact import CompactResult
+        return CompactResult.from_container(self)
 
     @property
     def regex(self):
@@ -73,6 +232,19 @@ class LogContainer(object):
         """
         return self._regex[:-1]
 
+    @property
+    def _compiled_regex(self):
+        """ compiled global regex pattern
+
+        Returns:
+            re.Pattern: compiled regex
+
+        """
+        compiled = self.__dict__.get("_compiled")
+        if compiled is None or compiled.pattern != self.regex:
+            compiled = self._compiled = re.compile(self.regex)
+        return compiled
+
     @staticmethod
     def _group_prefix(cls):
         """ intended named capturing group prefix
@@ -101,6 +273,9 @@ class LogContainer(object):
     def _append_pattern(self, cls):
         """ appends the container pattern to the global regex using the "|" alternator
 
+        Patterns spanning multiple lines will be matched by a :class:`logmole.multiline.LineWindow`
+        instead and don't become part of the global regex.
+
         Args:
             cls (LogContainer): container
 
@@ -120,13 +295,46 @@ class LogContainer(object):
                 "No matches will be added."
             )
 
+        if not isinstance(cls.span, int) or cls.span < 1:
+            raise ValueError("Container '{0}' span has to be a positive int, got {1!r}.".format(cls.__name__, cls.span))
+
         for named_group in named_groups:
             # namespace the group name
             container_pattern = container_pattern.replace("<{}>".format(named_group),
                                                           "<{}>".format(self._group_name(cls, named_group)))
-        self._regex += container_pattern + "|"
+        if cls.span > 1:
+            self._multiline_patterns += ((cls, container_pattern, cls.span), )
+        else:
+            self._regex += container_pattern + "|"
+            self._container_patterns += ((cls, container_pattern), )
         return named_groups
 
+    def _containers_regex(self, containers):
+        """ regex pattern that only includes the patterns of the given containers
+
+        Args:
+            containers (set): container classes
+
+        Returns:
+            str: regex pattern
+
+        """
+        return "|".join(pattern for cls, pattern in self._container_patterns if cls in containers)
+
+    def _line_window(self, containers=None):
+        """ creates the ring buffer that matches the multiline container patterns
+
+        Keyword Args:
+            containers (set): container classes whose patterns get included, all if None
+
+        Returns:
+            LineWindow: window or None if none of the containers uses a multiline pattern
+
+        """
+        patterns = [(re.compile(pattern), span) for cls, pattern, span in self._multiline_patterns
+                    if containers is None or cls in containers]
+        return LineWindow(patterns) if patterns else None
+
     def _create_members(self, cls, representative, parent):
         """ checks the container pattern and adds found members to its representative
 
@@ -223,55 +431,149 @@ class LogContainer(object):
         Returns:
 
         """
-        for match in regex_finditer_filter(data, self.regex):
-            for _ in match:
-                for key, value in _.groupdict().items():
-                    # check if the match group key has a real value
-                    if value:
-                        # check if we added a value before
-                        container = self._groups_map[key]["obj"]
-                        attr_name = self._groups_map[key]["attr"]
-                        existing_match = getattr(container, attr_name)
-                        converted_match = self._infer_type(container, attr_name, value)
-                        # handle multimatches by appending them or add them into the dict
-                        if existing_match and container:
-                            if isinstance(existing_match, list):
-                                existing_match.append(converted_match)
-                                existing_match = list(set(existing_match))
-                                existing_match.sort()
-                            # todo: support other key value storages
-                            elif isinstance(existing_match, dict):
-                                assert isinstance(converted_match, dict),\
-                                    "Can only add value to existing if it is of same type. " + \
-                                    "Got {0} for value '{1}, expected dict'".format(
-                                        type(converted_match),
-                                        value
-                                    )
-                                for _key, _value in converted_match.items():
-                                    existing_match[_key] = _value
-                            else:
-                                # although this is quite ugly we have to do this to ensure
-                                # that the second match will end up as part of the list and
-                                # not only creating
-                                existing_match = [existing_match]
-                                existing_match.append(converted_match)
-                                existing_match = list(set(existing_match))
-                        else:
-                            # otherwise simple add the string value
-                            existing_match = converted_match
-
-                        setattr(self._groups_map[key]["obj"], self._groups_map[key]["attr"], existing_match)
+        regex = self._compiled_regex if self.regex else None
+        window = self._line_window()
+
+        for line in data:
+            if regex is not None:
+                self._store_matches(regex.finditer(line))
+            if window is not None:
+                found = window.push(line)
+                if found:
+                    self._store_matches(match for _, match in found)
+
+        if window is not None:
+            self._store_matches(match for _, match in window.flush())
+
+    def _store_matches(self, matches):
+        """ adds all values of the given matches to their corresponding member
+
+        Args:
+            matches (iterable): match objects of the global regex
+
+        Returns:
+
+        """
+        self._store_groups((key, value) for match in matches for key, value in match.groupdict().items())
+
+    def _store_groups(self, groups):
+        """ adds matched values to the members of their named capturing groups
+
+        Multiple values of the same member get converted at once.
+
+        Args:
+            groups (iterable): (namespaced name of the capturing group, matched value) tuples
+
+        Returns:
+
+        """
+        values = OrderedDict()
+        for key, value in groups:
+            # check if the match group key has a real value
+            if value:
+                values.setdefault(key, []).append(value)
+
+        for key, key_values in values.items():
+            if len(key_values) == 1:
+                self._store_value(key, key_values[0])
+                continue
+            container = self._groups_map[key]["obj"]
+            attr_name = self._groups_map[key]["attr"]
+            for value, converted_match in zip(key_values, self._infer_types(container, attr_name, key_values)):
+                self._add_value(key, value, converted_match)
+
+    def _store_value(self, key, value):
+        """ converts a matched value and adds it to the member of the named capturing group
+
+        Args:
+            key (str): namespaced name of the capturing group
+            value (str): matched value
+
+        Returns:
+
+        """
+        container = self._groups_map[key]["obj"]
+        attr_name = self._groups_map[key]["attr"]
+        self._add_value(key, value, self._infer_type(container, attr_name, value))
+
+    def _add_value(self, key, value, converted_match):
+        """ adds a converted value to the member of the named capturing group
+
+        Args:
+            key (str): namespaced name of the capturing group
+            value (str): matched value
+            converted_match (undefined): converted value
+
+        Returns:
+
+        """
+        # share equal strings with other results
+        if self.string_pool is not None:
+            converted_match = self.string_pool.intern_value(converted_match)
+
+        # check if we added a value before
+        container = self._groups_map[key]["obj"]
+        attr_name = self._groups_map[key]["attr"]
+        existing_match = getattr(container, attr_name)
+        # handle multimatches by appending them or add them into the dict
+        if existing_match is not None and container:
+            if isinstance(existing_match, list):
+                existing_match.append(converted_match)
+                try:
+                    existing_match = list(set(existing_match))
+                except TypeError:
+                    # unhashable values like numpy arrays can neither be deduplicated nor sorted
+                    pass
+                else:
+                    existing_match.sort()
+            # todo: support other key value storages
+            elif isinstance(existing_match, dict):
+                assert isinstance(converted_match, dict),\
+                    "Can only add value to existing if it is of same type. " + \
+                    "Got {0} for value '{1}, expected dict'".format(
+                        type(converted_match),
+                        value
+                    )
+                for _key, _value in converted_match.items():
+                    existing_match[_key] = _value
+            else:
+                # although this is quite ugly we have to do this to ensure
+                # that the second match will end up as part of the list and
+                # not only creating
+                existing_match = [existing_match]
+                existing_match.append(converted_match)
+                try:
+                    existing_match = list(set(existing_match))
+                except TypeError:
+                    pass
+        else:
+            # otherwise simple add the string value
+            existing_match = converted_match
+
+        setattr(container, attr_name, existing_match)
 
     @staticmethod
     def _infer_type(cls, attr_name, value):
         inferred = cls.assumptions.call_action(value)
-        if not cls.infer_type and inferred != value:
+        # converted values may be numpy arrays, which can't be compared using !=
+        if not cls.infer_type and inferred is not value:
             LOG.info("Match '{0}' for attribute {1} of container {2} ".format(value, attr_name, cls) +
                      "could be automatically converted to {} if you set infer_type to True".format(type(inferred)))
         else:
             return inferred
         return value
 
+    @staticmethod
+    def _infer_types(cls, attr_name, values):
+        inferred = cls.assumptions.call_action_many(values)
+        if cls.infer_type:
+            return inferred
+        for value, _inferred in zip(values, inferred):
+            if _inferred is not value:
+                LOG.info("Match '{0}' for attribute {1} of container {2} ".format(value, attr_name, cls) +
+                         "could be automatically converted to {} if you set infer_type to True".format(type(_inferred)))
+        return values
+
     def get_value(self, member_name, default=None):
         """ get the value of nested members using a dot separated strings
 
@@ -286,27 +588,65 @@ class LogContainer(object):
                 return getattr(value["obj"], value["attr"])
         return default
 
-    def dump(self, filepath, **json_kwargs):
-        """ dumps the representation to a file using json
+    def dump(self, filepath, format="json", **json_kwargs):
+        """ dumps the representation to a file
+
+        Members get serialized as they are iterated, without creating the member tree first,
+        unless json keyword arguments are used the streaming writer doesn't support.
 
         Args:
             filepath (str): path to a file
+        Keyword Args:
+            format (str): "json", "ndjson" for a single compact line or "binary",
+                          see :mod:`logmole.serialization` to write multiple logs into one file
             **json_kwargs (undefined): all keyword arguments json.dump() supports
 
         Returns:
 
         """
+        from . import serialization
+
+        if format == "binary":
+            with open(filepath, "wb") as f:
+                serialization.write_binary([self], f)
+            return
+        if format == "ndjson":
+            json_kwargs["indent"] = None
+        elif format != "json":
+            raise ValueError("Unsupported format '{}'. Expected 'json', 'ndjson' or 'binary'.".format(format))
+
         json_kwargs.setdefault("indent", 4)
         json_kwargs.setdefault("sort_keys", True)
-        json_kwargs.setdefault("default", str)
+        json_kwargs.setdefault("default", json_default)
 
         with open(filepath, 'w') as f:
             try:
-                json.dump(self._tree, f, **json_kwargs)
+                if json_kwargs["sort_keys"] and set(json_kwargs) == {"indent", "sort_keys", "default"} and \
+                        (json_kwargs["indent"] is None or isinstance(json_kwargs["indent"], (int, str))):
+                    serialization.write_json(self, f, indent=json_kwargs["indent"], default=json_kwargs["default"])
+                else:
+                    json.dump(self._tree, f, **json_kwargs)
+                if format == "ndjson":
+                    f.write("\n")
             except (IOError, OSError, TypeError):
                 raise
 
 
+def json_default(value):
+    """ fallback for values json can't serialize natively, arrays will become lists
+
+    Args:
+        value (undefined): value to serialize
+
+    Returns:
+        list or str: serializable representation
+
+    """
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
 def regex_finditer_filter(lines, pattern):
     """ regex filter
 
@@ -0,0 +1,312 @@
+from array import array
+from collections import OrderedDict
+import hashlib
+import os
+import struct
+import sys
+
+from .utilities import (
+    decode_line,
+    iter_lines_with_offsets
+)
+
+INDEX_SUFFIX = ".lmidx"
+
+_MAGIC = b"LMIX"
+_VERSION = 2
+# magic, version
+_FORMAT = struct.Struct("<4sH")
+# magic, version, schema fingerprint, log size, log modification time in ns, log inode, amount of members
+_HEADER = struct.Struct("<4sH20sQQQI")
+# member name length, amount of matched lines
+_MEMBER_HEADER = struct.Struct("<HQ")
+
+
+class LogIndexError(ValueError):
+    pass
+
+
+def schema_fingerprint(container):
+    """ digest that identifies the regex chain and members of a container
+
+    Args:
+        container (LogContainer): container class or instance
+
+    Returns:
+        bytes: sha1 digest
+
+    """
+    if isinstance(container, type):
+        container = container._new()
+    members = sorted(_["member_name"] for _ in container._groups_map.values())
+    multiline = ["{0}:{1}".format(span, pattern) for _, pattern, span in container._multiline_patterns]
+    return hashlib.sha1("\n".join([container.regex] + multiline + members).encode("utf-8")).digest()
+
+
+def _log_signature(stat):
+    # the inode changes if the log gets replaced, even within the resolution of the modification time
+    return stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+class LogIndex(object):
+    """ byte offsets and line numbers of each member's matches within a log
+
+    The index gets stored in a compact sidecar file next to the log. It is versioned by the
+    fingerprint of the container it was built with and by the size, modification time and inode
+    of the log, so it can't be used with a changed schema or log.
+
+    Args:
+        path (str): path to the log
+        fingerprint (bytes): schema fingerprint of the container used to build the index
+        members (dict): {member name: (offsets, line numbers)} where both are arrays
+    Keyword Args:
+        signature (tuple): (size, modification time in ns, inode) of the log the index covers,
+                           the current state of the log if None
+
+    Examples:
+        >>> container, index = LogIndex.build(MovieLog, "/tmp/some.log")
+        >>> for line_number, line in LogIndex.load(MovieLog, "/tmp/some.log").lines("scene.entities"):
+        ...     print(line_number, line)
+
+    """
+
+    def __init__(self, path, fingerprint, members, signature=None):
+        self._path = path
+        self._fingerprint = fingerprint
+        self._members = members
+        self._signature = signature
+
+    @staticmethod
+    def index_path(path):
+        """ path of the sidecar file that belongs to the given log
+
+        Args:
+            path (str): path to the log
+
+        Returns:
+            str: path to the index file
+
+        """
+        return path + INDEX_SUFFIX
+
+    @property
+    def members(self):
+        """ names of all members with at least one match
+
+        Returns:
+            list: dot separated member names
+
+        """
+        return list(self._members.keys())
+
+    def offsets(self, member_name):
+        """ byte offsets of the lines the member matched on
+
+        Args:
+            member_name (str): dot separated member name
+
+        Returns:
+            array: byte offsets in ascending order
+
+        """
+        return self._members.get(member_name, (array("Q"), array("I")))[0]
+
+    def line_numbers(self, member_name):
+        """ line numbers (starting at 1) of the lines the member matched on
+
+        Args:
+            member_name (str): dot separated member name
+
+        Returns:
+            array: line numbers in ascending order
+
+        """
+        return self._members.get(member_name, (array("Q"), array("I")))[1]
+
+    def lines(self, member_name, encoding="utf-8"):
+        """ seeks directly to the lines the member matched on
+
+        Args:
+            member_name (str): dot separated member name
+        Keyword Args:
+            encoding (str): encoding of the log
+
+        Yields:
+            tuple: (line number, line)
+
+        """
+        offsets = self.offsets(member_name)
+        line_numbers = self.line_numbers(member_name)
+        with open(self._path, "rb") as f:
+            for offset, line_number in zip(offsets, line_numbers):
+                f.seek(offset)
+                yield line_number, decode_line(f.readline(), encoding)
+
+    @classmethod
+    def build(cls, container_cls, path, encoding="utf-8", index_path=None, write=True):
+        """ parses the log and records the matched lines of each member
+
+        Args:
+            container_cls (type): LogContainer subclass that describes the log
+            path (str): path to the log
+        Keyword Args:
+            encoding (str): encoding of the log
+            index_path (str): path of the sidecar file, next to the log if None
+            write (bool): if True the index gets saved
+
+        Returns:
+            tuple: (parsed LogContainer, LogIndex)
+
+        """
+        container = container_cls._new()
+        member_names = {key: value["member_name"] for key, value in container._groups_map.items()}
+        members = OrderedDict()
+
+        def add(offset, line_number, matches):
+            matched = set()
+            for match in matches:
+                matched.update(key for key, value in match.groupdict().items() if value)
+            for member_name in {member_names[key] for key in matched}:
+                offsets, line_numbers = members.setdefault(member_name, (array("Q"), array("I")))
+                offsets.append(offset)
+                line_numbers.append(line_number)
+            container._store_matches(matches)
+
+        regex = container._compiled_regex if container.regex else None
+        # multiline matches get recorded for the line they start in
+        window = container._line_window()
+
+        with open(path, "rb") as f:
+            # the log may still be written, only the bytes it had when it was opened get indexed
+            stat = os.fstat(f.fileno())
+            if regex is not None or window is not None:
+                for line_number, (offset, raw) in enumerate(iter_lines_with_offsets(f, 0, stat.st_size), 1):
+                    if offset + len(raw) > stat.st_size:
+                        # the line got appended to after opening, a multibyte character may be cut off
+                        line = raw[:stat.st_size - offset].decode(encoding, "ignore")
+                    else:
+                        line = decode_line(raw, encoding)
+                    if window is not None:
+                        for (_offset, _line_number), match in window.push(line, (offset, line_number)):
+                            add(_offset, _line_number, [match])
+                    if regex is not None:
+                        matches = list(regex.finditer(line))
+                        if matches:
+                            add(offset, line_number, matches)
+            if window is not None:
+                for (_offset, _line_number), match in window.flush():
+                    add(_offset, _line_number, [match])
+                # multiline matches are reported delayed, restore the line order
+                for member_name, (offsets, line_numbers) in members.items():
+                    lines = sorted(set(zip(offsets, line_numbers)))
+                    members[member_name] = (array("Q", [_[0] for _ in lines]), array("I", [_[1] for _ in lines]))
+
+        index = cls(path, schema_fingerprint(container), OrderedDict(sorted(members.items())),
+                    signature=_log_signature(stat))
+        if write:
+            index.save(index_path)
+        return container, index
+
+    def save(self, index_path=None):
+        """ writes the index to its sidecar file
+
+        Keyword Args:
+            index_path (str): path of the sidecar file, next to the log if None
+
+        Returns:
+
+        """
+        size, mtime, inode = self._signature or _log_signature(os.stat(self._path))
+        with open(index_path or self.index_path(self._path), "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, self._fingerprint, size, mtime, inode, len(self._members)))
+            for member_name, (offsets, line_numbers) in self._members.items():
+                name = member_name.encode("utf-8")
+                f.write(_MEMBER_HEADER.pack(len(name), len(offsets)))
+                f.write(name)
+                f.write(_little_endian(offsets).tobytes())
+                f.write(_little_endian(line_numbers).tobytes())
+
+    @classmethod
+    def load(cls, container_cls, path, index_path=None):
+        """ reads the sidecar file of a log
+
+        Args:
+            container_cls (type): LogContainer subclass the index was built with
+            path (str): path to the log
+        Keyword Args:
+            index_path (str): path of the sidecar file, next to the log if None
+
+        Raises:
+            LogIndexError: if the index is invalid or doesn't match the container or log anymore
+
+        Returns:
+            LogIndex: loaded index
+
+        """
+        with open(index_path or cls.index_path(path), "rb") as f:
+            data = f.read()
+
+        if len(data) < _FORMAT.size:
+            raise LogIndexError("Index of '{}' is truncated.".format(path))
+        magic, version = _FORMAT.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise LogIndexError("Index of '{0}' has an unsupported format or version {1}.".format(path, version))
+        if len(data) < _HEADER.size:
+            raise LogIndexError("Index of '{}' is truncated.".format(path))
+        _, _, fingerprint, size, mtime, inode, member_count = _HEADER.unpack_from(data)
+        if fingerprint != schema_fingerprint(container_cls):
+            raise LogIndexError("Index of '{0}' wasn't built with container '{1}'.".format(path,
+                                                                                          container_cls.__name__))
+        if (size, mtime, inode) != _log_signature(os.stat(path)):
+            raise LogIndexError("Index of '{}' is outdated.".format(path))
+
+        members = OrderedDict()
+        position = _HEADER.size
+        try:
+            for _ in range(member_count):
+                name_length, count = _MEMBER_HEADER.unpack_from(data, position)
+                position += _MEMBER_HEADER.size
+                member_name = data[position:position + name_length].decode("utf-8")
+                position += name_length
+
+                offsets, line_numbers = array("Q"), array("I")
+                for values in (offsets, line_numbers):
+                    length = count * values.itemsize
+                    if position + length > len(data):
+                        raise LogIndexError("Index of '{}' is truncated.".format(path))
+                    values.frombytes(data[position:position + length])
+                    position += length
+                    if sys.byteorder != "little":
+                        values.byteswap()
+                members[member_name] = (offsets, line_numbers)
+        except struct.error:
+            raise LogIndexError("Index of '{}' is truncated.".format(path))
+
+        return cls(path, fingerprint, members, signature=(size, mtime, inode))
+
+    @classmethod
+    def load_or_build(cls, container_cls, path, encoding="utf-8", index_path=None):
+        """ loads the sidecar file of a log or rebuilds it if it is missing or outdated
+
+        Args:
+            container_cls (type): LogContainer subclass that describes the log
+            path (str): path to the log
+        Keyword Args:
+            encoding (str): encoding of the log
+            index_path (str): path of the sidecar file, next to the log if None
+
+        Returns:
+            LogIndex: valid index
+
+        """
+        try:
+            return cls.load(container_cls, path, index_path=index_path)
+        except (IOError, OSError, LogIndexError):
+            return cls.build(container_cls, path, encoding=encoding, index_path=index_path)[1]
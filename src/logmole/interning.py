@@ -0,0 +1,105 @@
+import sys
+
+DEFAULT_MAXSIZE = 1 << 16
+
+
+class StringPool(object):
+    """ a bounded pool that shares equal strings between parsed results
+
+    Once the pool is full no further strings will be added, but already pooled strings
+    will still be shared. The counters are meant for monitoring and are not synchronized
+    between threads.
+
+    Keyword Args:
+        maxsize (int): maximum amount of pooled strings
+
+    Examples:
+        >>> class RenderLog(LogContainer):
+        ...     string_pool = StringPool(maxsize=10000)
+
+    """
+
+    def __init__(self, maxsize=DEFAULT_MAXSIZE):
+        self._maxsize = maxsize
+        self._strings = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __contains__(self, string):
+        return string in self._strings
+
+    @property
+    def maxsize(self):
+        return self._maxsize
+
+    def intern(self, string):
+        """ returns the pooled instance of an equal string
+
+        Args:
+            string (str): string to share
+
+        Returns:
+            str: pooled string or the given string if it isn't pooled and the pool is full
+
+        """
+        pooled = self._strings.get(string)
+        if pooled is not None:
+            self.hits += 1
+            if pooled is not string:
+                self.saved_bytes += sys.getsizeof(string)
+            return pooled
+
+        self.misses += 1
+        if len(self._strings) < self._maxsize:
+            self._strings[string] = string
+        return string
+
+    def intern_value(self, value):
+        """ shares strings and the string keys and values of dictionaries
+
+        Args:
+            value (undefined): converted value of a member
+
+        Returns:
+            undefined: value using pooled strings
+
+        """
+        if isinstance(value, str):
+            return self.intern(value)
+        if isinstance(value, dict):
+            intern = self.intern
+            return {
+                intern(key) if isinstance(key, str) else key: intern(_value) if isinstance(_value, str) else _value
+                for key, _value in value.items()
+            }
+        return value
+
+    def clear(self):
+        """ removes all pooled strings and resets the counters """
+        self._strings.clear()
+        self.hits = 0
+        self.misses = 0
+        self.saved_bytes = 0
+
+    def stats(self):
+        """ current usage of the pool
+
+        Returns:
+            dict: size, maxsize, hits, misses and the bytes saved by sharing strings
+
+        """
+        return {
+            "size": len(self._strings),
+            "maxsize": self._maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "saved_bytes": self.saved_bytes
+        }
+
+
+# pool to share strings between containers of different types
+GLOBAL_STRING_POOL = StringPool()
@@ -0,0 +1,84 @@
+from collections import deque
+from itertools import islice
+
+
+class LineWindow(object):
+    """ bounded ring buffer of recent lines that matches multiline patterns across them
+
+    Only the last `span` lines of the largest span are kept, so memory stays constant no
+    matter how large the log is. Each line gets matched once it is the oldest buffered line,
+    using a window of the following lines up to the span of the pattern. Only matches that
+    start within the oldest line are reported, and a match never overlaps a previous match of
+    the same pattern, so each record gets captured exactly once.
+    All lines in the window end with a newline.
+
+    Args:
+        patterns (list): (compiled regex, span) tuples, the span is the maximum amount of lines
+                         a match may cover
+
+    """
+
+    def __init__(self, patterns):
+        self._patterns = list(patterns)
+        self._lines = deque(maxlen=max(span for _, span in self._patterns))
+        self._tags = deque()
+        # absolute position up to which each pattern already matched
+        self._consumed = [0] * len(self._patterns)
+        # absolute position of the oldest buffered line
+        self._position = 0
+
+    def push(self, line, tag=None):
+        """ adds a line and matches the window of the oldest line once the buffer is full
+
+        Args:
+            line (str): next line of the log
+        Keyword Args:
+            tag (undefined): reported together with all matches starting within this line
+
+        Returns:
+            list: (tag, match) tuples
+
+        """
+        found = self._advance() if len(self._lines) == self._lines.maxlen else []
+        self._lines.append(line if line.endswith("\n") else line + "\n")
+        self._tags.append(tag)
+        return found
+
+    def flush(self):
+        """ matches the windows of all remaining lines, needed once the log ended
+
+        Returns:
+            list: (tag, match) tuples
+
+        """
+        found = []
+        while self._lines:
+            found.extend(self._advance())
+        return found
+
+    def _advance(self):
+        """ matches the window of the oldest line and removes it from the buffer
+
+        Returns:
+            list: (tag, match) tuples
+
+        """
+        lines = self._lines
+        first = lines[0]
+        tag = self._tags.popleft()
+        position = self._position
+        found = []
+        for i, (regex, span) in enumerate(self._patterns):
+            start = self._consumed[i] - position
+            if start >= len(first):
+                continue
+            window = "".join(lines) if span >= len(lines) else "".join(islice(lines, span))
+            for match in regex.finditer(window, max(start, 0)):
+                if match.start() >= len(first):
+                    break
+                found.append((tag, match))
+                self._consumed[i] = position + match.end()
+
+        self._position = position + len(first)
+        lines.popleft()
+        return found
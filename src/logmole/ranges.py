@@ -0,0 +1,197 @@
+import os
+import re
+import sys
+
+from .utilities import (
+    decode_line,
+    iter_lines_with_offsets
+)
+
+
+class Region(object):
+    """ a byte range of a file and the containers that apply to it
+
+    Offsets behave like slice indices, so negative values are relative to the end of the file.
+    The range will be aligned to line boundaries. A line partially covered at the start is skipped,
+    a line partially covered at the end is included.
+
+    Args:
+        start (int): first byte of the region
+        end (int): byte the region stops at, the end of the file if None
+    Keyword Args:
+        containers (list): containers of the chain that apply to the region, all if None
+
+    """
+
+    def __init__(self, start=0, end=None, containers=None):
+        self.start = start
+        self.end = end
+        self.containers = containers
+
+    def __repr__(self):
+        return "{0}({1}, {2}, containers={3})".format(self.__class__.__name__, self.start, self.end, self.containers)
+
+    @classmethod
+    def head(cls, size, containers=None):
+        """ region covering the first `size` bytes
+
+        Args:
+            size (int): amount of bytes
+        Keyword Args:
+            containers (list): containers of the chain that apply to the region, all if None
+
+        Returns:
+            Region: region at the start of the file
+
+        """
+        return cls(0, size, containers=containers)
+
+    @classmethod
+    def tail(cls, size, containers=None):
+        """ region covering the last `size` bytes
+
+        Args:
+            size (int): amount of bytes
+        Keyword Args:
+            containers (list): containers of the chain that apply to the region, all if None
+
+        Returns:
+            Region: region at the end of the file
+
+        """
+        if size <= 0:
+            # -0 would be the start of the file, so empty tails start behind its end instead
+            return cls(sys.maxsize, None, containers=containers)
+        return cls(-size, None, containers=containers)
+
+    def resolve(self, file_size):
+        """ absolute byte range within a file of the given size
+
+        Args:
+            file_size (int): size of the file in bytes
+
+        Returns:
+            tuple: (start, end)
+
+        """
+        start, end, _ = slice(self.start, self.end).indices(file_size)
+        return start, max(start, end)
+
+
+def _align(f, position, file_size):
+    """ moves a position forward to the start of the next line unless it already is one
+
+    Args:
+        f (file): file opened in binary mode
+        position (int): byte offset
+        file_size (int): size of the file in bytes
+
+    Returns:
+        int: byte offset of a line start
+
+    """
+    if position <= 0:
+        return 0
+    if position >= file_size:
+        return file_size
+    f.seek(position - 1)
+    if f.read(1) == b"\n":
+        return position
+    f.readline()
+    return f.tell()
+
+
+def _chain_containers(*containers):
+    """ all containers that are part of the chain of the given containers
+
+    Args:
+        *containers (type): LogContainer subclasses
+
+    Returns:
+        set: container classes
+
+    """
+    chained = set()
+    pending = list(containers)
+    while pending:
+        container = pending.pop()
+        if container not in chained:
+            chained.add(container)
+            pending.extend(container.sub_containers)
+    return chained
+
+
+def parse_regions(container_cls, path, regions, encoding="utf-8"):
+    """ parses only the given regions of a file
+
+    Each line gets parsed at most once, even if regions overlap. Lines covered by multiple
+    regions will be matched by the containers of all of them. Multiline patterns only match
+    within a region, they can't capture lines beyond its end.
+
+    Args:
+        container_cls (type): LogContainer subclass that describes the log
+        path (str): path to the log
+        regions (list): Region objects
+    Keyword Args:
+        encoding (str): encoding of the log
+
+    Returns:
+        LogContainer: container holding the matches of all regions
+
+    Examples:
+        >>> log = parse_regions(RenderLog, "/tmp/render.log", [Region.head(1 << 20, containers=[HeaderContainer]),
+        ...                                                    Region.tail(1 << 20, containers=[StatsContainer])])
+
+    """
+    chained = _chain_containers(container_cls)
+    for region in regions:
+        for region_container in region.containers or []:
+            if region_container not in chained:
+                raise ValueError("Container '{0}' isn't part of the chain of '{1}'.".format(region_container.__name__,
+                                                                                          container_cls.__name__))
+
+    container = container_cls._new()
+    file_size = os.path.getsize(path)
+    compiled = {}
+
+    with open(path, "rb") as f:
+        spans = []
+        for region in regions:
+            start, end = region.resolve(file_size)
+            spans.append((_align(f, start, file_size), _align(f, end, file_size), region.containers))
+
+        # multiline windows continue across adjacent segments covered by the same containers
+        window = window_state = None
+        boundaries = sorted({boundary for span in spans for boundary in span[:2]})
+        for start, end in zip(boundaries, boundaries[1:]):
+            covering = [containers for span_start, span_end, containers in spans if span_start <= start < span_end]
+            if not covering:
+                continue
+
+            # None means the whole chain applies
+            key = None
+            if all(containers is not None for containers in covering):
+                key = frozenset(_chain_containers(*[_ for containers in covering for _ in containers]))
+            if key not in compiled:
+                pattern = container.regex if key is None else container._containers_regex(key)
+                compiled[key] = re.compile(pattern) if pattern else None
+            regex = compiled[key]
+            if window_state != (key, start):
+                if window is not None:
+                    container._store_matches(match for _, match in window.flush())
+                window = container._line_window(key)
+            window_state = (key, end)
+            if regex is None and window is None:
+                continue
+
+            for _, raw in iter_lines_with_offsets(f, start, end):
+                line = decode_line(raw, encoding)
+                if regex is not None:
+                    container._store_matches(regex.finditer(line))
+                if window is not None:
+                    container._store_matches(match for _, match in window.push(line))
+
+        if window is not None:
+            container._store_matches(match for _, match in window.flush())
+
+    return container
@@ -0,0 +1,398 @@
+from array import array
+import datetime
+import json
+import struct
+import sys
+
+from .containers import json_default
+from .utilities import member_tree
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BINARY_MAGIC = b"LMOL"
+BINARY_VERSION = 1
+
+_UINT = struct.Struct("<I")
+_INT = struct.Struct("<q")
+_FLOAT = struct.Struct("<d")
+_TIME = struct.Struct("<BBBI")
+_SHAPE = struct.Struct("<II")
+# smallest array typecodes for signed integers of 1, 2, 4 and 8 bytes
+_INT_TYPECODES = [(8 * array(_).itemsize - 1, _) for _ in "bhiq"]
+
+
+def _sorted_members(result):
+    # sorting by the name parts keeps members of the same representative together
+    return sorted(result._iter_members(), key=lambda member: member[0].split("."))
+
+
+def iter_json(result, indent=None, default=json_default):
+    """ serializes the members of a result to json without creating its member tree
+
+    The output is equal to json.dumps() of the member tree using sort_keys=True.
+
+    Args:
+        result (LogContainer): parsed container or its CompactResult
+    Keyword Args:
+        indent (int or str): indentation like json uses it, compact output if None
+        default (callable): fallback for values json can't serialize natively
+
+    Yields:
+        str: json chunks
+
+    """
+    key_separator = ": " if indent is not None else ":"
+    # same as json, an int indents by that many spaces and a str is used as it is
+    indent_string = " " * indent if isinstance(indent, int) else indent
+
+    def newline(depth):
+        return "\n" + indent_string * depth if indent is not None else ""
+
+    def dumps(value, depth):
+        dumped = json.dumps(value, indent=indent, sort_keys=True, default=default,
+                            separators=(",", key_separator))
+        # nested values have to be indented relative to the current depth
+        return dumped.replace("\n", newline(depth)) if indent is not None else dumped
+
+    path = []
+    first = True
+    yield "{"
+    for member_name, value in _sorted_members(result):
+        parts = member_name.split(".")
+
+        # close representatives the member doesn't belong to
+        common = 0
+        while common < min(len(path), len(parts) - 1) and path[common] == parts[common]:
+            common += 1
+        while len(path) > common:
+            path.pop()
+            yield newline(len(path) + 1) + "}"
+
+        # open the representatives of the member
+        for part in parts[len(path):-1]:
+            yield ("" if first else ",") + newline(len(path) + 1) + json.dumps(part) + key_separator + "{"
+            path.append(part)
+            first = True
+
+        yield ("" if first else ",") + newline(len(path) + 1) + json.dumps(parts[-1]) + key_separator
+        yield dumps(value, len(path) + 1)
+        first = False
+
+    while path:
+        path.pop()
+        yield newline(len(path) + 1) + "}"
+    yield "}" if first else newline(0) + "}"
+
+
+def write_json(result, fp, indent=4, default=json_default):
+    """ streams the members of a result as json into a file object
+
+    Args:
+        result (LogContainer): parsed container or its CompactResult
+        fp (file): text file object
+    Keyword Args:
+        indent (int or str): indentation like json uses it, compact output if None
+        default (callable): fallback for values json can't serialize natively
+
+    Returns:
+
+    """
+    for chunk in iter_json(result, indent=indent, default=default):
+        fp.write(chunk)
+
+
+def write_ndjson(results, fp, default=json_default):
+    """ writes one compact json line per result
+
+    Args:
+        results (iterable): parsed containers or CompactResults
+        fp (file): text file object
+    Keyword Args:
+        default (callable): fallback for values json can't serialize natively
+
+    Returns:
+
+    """
+    for result in results:
+        write_json(result, fp, indent=None, default=default)
+        fp.write("\n")
+
+
+def iter_ndjson(fp):
+    """ loads the member trees of a newline delimited json file
+
+    Args:
+        fp (file): text file object
+
+    Yields:
+        dict: member tree per line
+
+    """
+    for line in fp:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _float_rows(value):
+    """ shape of a two dimensional float array
+
+    Args:
+        value (list): value to check
+
+    Returns:
+        tuple: (rows, columns) or None if the value is not an even sized list of float lists
+
+    """
+    if not value or not isinstance(value[0], list) or not value[0]:
+        return None
+    columns = len(value[0])
+    for row in value:
+        if not isinstance(row, list) or len(row) != columns:
+            return None
+        for item in row:
+            if item.__class__ is not float:
+                return None
+    return len(value), columns
+
+
+def _int_typecode(values):
+    """ smallest array typecode that can hold all values of an integer list
+
+    Args:
+        values (list): value to check
+
+    Returns:
+        str: typecode or None if the value is not a list of integers
+
+    """
+    for item in values:
+        if item.__class__ is not int:
+            return None
+    low, high = min(values), max(values)
+    for bits, typecode in _INT_TYPECODES:
+        if -(1 << bits) <= low and high < (1 << bits):
+            return typecode
+    return None
+
+
+def _little_endian(values):
+    if sys.byteorder != "little":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+
+def _encode(value, write):
+    """ writes a tagged binary representation of a value
+
+    Args:
+        value (undefined): value to encode
+        write (callable): write function of a binary file object
+
+    Returns:
+
+    """
+    if value is None:
+        write(b"N")
+    elif value is True:
+        write(b"T")
+    elif value is False:
+        write(b"F")
+    elif isinstance(value, int):
+        if -(1 << 63) <= value < (1 << 63):
+            write(b"i" + _INT.pack(value))
+        else:
+            encoded = str(value).encode("ascii")
+            write(b"n" + _UINT.pack(len(encoded)) + encoded)
+    elif isinstance(value, float):
+        write(b"d" + _FLOAT.pack(value))
+    elif isinstance(value, str):
+        encoded = value.encode("utf-8")
+        write(b"s" + _UINT.pack(len(encoded)) + encoded)
+    elif isinstance(value, datetime.time):
+        write(b"t" + _TIME.pack(value.hour, value.minute, value.second, value.microsecond))
+    elif isinstance(value, dict):
+        write(b"m" + _UINT.pack(len(value)))
+        for key, _value in value.items():
+            _encode(key, write)
+            _encode(_value, write)
+    elif isinstance(value, list):
+        shape = _float_rows(value)
+        typecode = _int_typecode(value) if value and shape is None else None
+        if shape is not None:
+            # two dimensional number arrays get packed as raw doubles
+            write(b"a" + _SHAPE.pack(*shape))
+            write(_little_endian(array("d", [_ for row in value for _ in row])).tobytes())
+        elif typecode is not None:
+            # integer lists get packed using the smallest fitting integer size
+            write(b"I" + typecode.encode("ascii") + _UINT.pack(len(value)))
+            write(_little_endian(array(typecode, value)).tobytes())
+        else:
+            write(b"l" + _UINT.pack(len(value)))
+            for _value in value:
+                _encode(_value, write)
+    elif numpy is not None and isinstance(value, numpy.ndarray) and value.ndim == 2 and value.dtype.kind == "f":
+        write(b"a" + _SHAPE.pack(*value.shape))
+        write(numpy.ascontiguousarray(value, dtype="<f8").tobytes())
+    elif hasattr(value, "tolist"):
+        _encode(value.tolist(), write)
+    else:
+        _encode(str(value), write)
+
+
+class _Decoder(object):
+
+    def __init__(self, data, as_array=False):
+        self._data = data
+        self._as_array = as_array and numpy is not None
+        self.position = 0
+
+    def _unpack(self, structure):
+        values = structure.unpack_from(self._data, self.position)
+        self.position += structure.size
+        return values
+
+    def _bytes(self, length):
+        end = self.position + length
+        if end > len(self._data):
+            raise ValueError("Unexpected end of binary data.")
+        data = self._data[self.position:end]
+        self.position = end
+        return data
+
+    def decode(self):
+        tag = self._bytes(1)
+        if tag == b"N":
+            return None
+        if tag == b"T":
+            return True
+        if tag == b"F":
+            return False
+        if tag == b"i":
+            return self._unpack(_INT)[0]
+        if tag == b"d":
+            return self._unpack(_FLOAT)[0]
+        if tag == b"n":
+            return int(self._bytes(self._unpack(_UINT)[0]))
+        if tag == b"s":
+            return self._bytes(self._unpack(_UINT)[0]).decode("utf-8")
+        if tag == b"t":
+            return datetime.time(*self._unpack(_TIME))
+        if tag == b"m":
+            value = {}
+            for _ in range(self._unpack(_UINT)[0]):
+                key = self.decode()
+                value[key] = self.decode()
+            return value
+        if tag == b"l":
+            decode = self.decode
+            return [decode() for _ in range(self._unpack(_UINT)[0])]
+        if tag == b"I":
+            typecode = self._bytes(1).decode("ascii")
+            values = array(typecode)
+            values.frombytes(self._bytes(self._unpack(_UINT)[0] * values.itemsize))
+            if sys.byteorder != "little":
+                values.byteswap()
+            return values.tolist()
+        if tag == b"a":
+            rows, columns = self._unpack(_SHAPE)
+            data = self._bytes(rows * columns * 8)
+            if self._as_array:
+                return numpy.frombuffer(data, dtype="<f8").reshape(rows, columns)
+            values = array("d")
+            values.frombytes(data)
+            if sys.byteorder != "little":
+                values.byteswap()
+            values = values.tolist()
+            return [values[i:i + columns] for i in range(0, len(values), columns)]
+        raise ValueError("Unknown binary tag {!r}.".format(tag))
+
+
+class BinaryWriter(object):
+    """ writes the members of many results into one compact binary stream
+
+    Numbers are packed, times are stored as their components and two dimensional float arrays
+    as raw doubles. Values without a binary representation get stored as str.
+
+    Args:
+        fp (file): binary file object
+
+    Examples:
+        >>> with open("/tmp/logs.lmol", "wb") as f:
+        ...     writer = BinaryWriter(f)
+        ...     for path in paths:
+        ...         writer.write(MovieLog(path))
+
+    """
+
+    def __init__(self, fp):
+        self._fp = fp
+        fp.write(BINARY_MAGIC + struct.pack("<B", BINARY_VERSION))
+
+    def write(self, result):
+        """ writes the members of a result
+
+        Args:
+            result (LogContainer): parsed container or its CompactResult
+
+        Returns:
+
+        """
+        chunks = []
+        members = _sorted_members(result)
+        chunks.append(_UINT.pack(len(members)))
+        for member_name, value in members:
+            _encode(member_name, chunks.append)
+            _encode(value, chunks.append)
+        record = b"".join(chunks)
+        self._fp.write(_UINT.pack(len(record)) + record)
+
+
+def write_binary(results, fp):
+    """ writes many results into a compact binary stream
+
+    Args:
+        results (iterable): parsed containers or CompactResults
+        fp (file): binary file object
+
+    Returns:
+
+    """
+    writer = BinaryWriter(fp)
+    for result in results:
+        writer.write(result)
+
+
+def iter_binary(fp, as_array=False):
+    """ loads the member trees of a binary stream
+
+    Args:
+        fp (file): binary file object
+    Keyword Args:
+        as_array (bool): load two dimensional float arrays as read-only numpy.ndarray views on the
+                         loaded data if numpy is available
+
+    Yields:
+        dict: member tree per result
+
+    """
+    header = fp.read(len(BINARY_MAGIC) + 1)
+    if header[:len(BINARY_MAGIC)] != BINARY_MAGIC:
+        raise ValueError("Not a logmole binary stream.")
+    if header[len(BINARY_MAGIC):] != struct.pack("<B", BINARY_VERSION):
+        raise ValueError("Unsupported logmole binary version.")
+
+    while True:
+        length = fp.read(_UINT.size)
+        if not length:
+            break
+        record = fp.read(_UINT.unpack(length)[0])
+        decoder = _Decoder(record, as_array=as_array)
+        members = []
+        for _ in range(decoder._unpack(_UINT)[0]):
+            member_name = decoder.decode()
+            members.append((member_name, decoder.decode()))
+        yield member_tree(members)
@@ -1,3 +1,4 @@
+from collections import OrderedDict
 from copy import deepcopy
 import datetime
 import logging
@@ -5,10 +6,32 @@ import re
 
 from .utilities import chunks
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 LOG = logging.getLogger("logmole.types")
 
 
-class TimeType(object):
+class BaseType(object):
+    """ base of all custom types, subclasses convert a string on call """
+
+    def convert_many(self, strings):
+        """ converts multiple values at once
+
+        Args:
+            strings (list): the original values that will be converted
+
+        Returns:
+            list: converted values in the same order
+
+        """
+        convert = self.__call__
+        return [convert(_) for _ in strings]
+
+
+class TimeType(BaseType):
     """ given a string the class will generate a datetime.time object
 
     Object will automatically detect a time signature under specific conditions
@@ -21,32 +44,39 @@ class TimeType(object):
 
     microsecond can be detected as well, but is considered as optional
     """
-    def __call__(self, string):
+    @staticmethod
+    def _split(string):
+        # same as matching ^(\d{1,2}):(\d{1,2}):(\d{1,2})(:\d{1,6})?$ but without a regex
         # we always expect always h:m:s information h:m:s:ms is optional
-        pattern = r"^(?P<h>\d{1,2})\:(?P<m>\d{1,2})\:(?P<s>\d{1,2})(\:(?P<ms>\d{1,6}))?$"
-
-        match = re.match(pattern, string)
-        if match:
-
-            # convert non existing microseconds
-            group_dict = match.groupdict()
-            if group_dict["ms"] is None:
-                group_dict["ms"] = 0
-
-            time = [int(group_dict["h"]), int(group_dict["m"]), int(group_dict["s"]), int(group_dict["ms"])]
+        parts = string[:-1].split(":") if string.endswith("\n") else string.split(":")
+        if len(parts) == 3:
+            h, m, s = parts
+            ms = "0"
+        elif len(parts) == 4:
+            h, m, s, ms = parts
+            if len(ms) > 6 or not ms.isdecimal():
+                return None
+        else:
+            return None
+        if len(h) > 2 or len(m) > 2 or len(s) > 2 or not (h.isdecimal() and m.isdecimal() and s.isdecimal()):
+            return None
+        return [int(h), int(m), int(s), int(ms)]
 
+    def __call__(self, string):
+        time = self._split(string)
+        if time:
             if time[0] < 24 and time[1] <= 60 and time[2] < 60 and time[3] <= 999999:
                 return datetime.time(*time)
             else:
                 try:
                     raise TypeAssumptionError("No valid time signature.")
                 except TypeAssumptionError:
-                    LOG.error("Unable to convert '{}' to time object.", exc_info=True)
+                    LOG.error("Unable to convert '{}' to time object.".format(string), exc_info=True)
 
         return string
 
 
-class TwoDimensionalNumberArrayType(object):
+class TwoDimensionalNumberArrayType(BaseType):
     """ given a string the class will generate a two dimensional array/list
 
     Object will perform a regex pattern match and expect a 'number' named capturing
@@ -56,21 +86,35 @@ class TwoDimensionalNumberArrayType(object):
         pattern (str): regex pattern
     Keyword Args:
         item_array_size (int): length each individual item will have
+        as_array (bool): if True a numpy.ndarray of shape (n, item_array_size) will be returned
+                         Falls back to the list representation if numpy is not available or
+                         the amount of numbers is not a multiple of item_array_size
 
     Notes:
         Expects that all items will use the same amount of numbers.
 
     """
-    def __init__(self, pattern, item_array_size=1):
+    def __init__(self, pattern, item_array_size=1, as_array=False):
         self._pattern = pattern
+        self._regex = re.compile(pattern)
         self._item_array_size = item_array_size
+        self._as_array = as_array
+
+    def _find_numbers(self, string):
+        # findall returns the matched strings directly if 'number' is the only group
+        if self._regex.groups == 1:
+            return self._regex.findall(string)
+        return [_.group("number") for _ in self._regex.finditer(string)]
 
     def __call__(self, string):
-        match = [_ for _ in re.finditer(self._pattern, string)]
+        numbers = self._find_numbers(string)
+
+        if numbers:
+            if self._as_array and numpy is not None and not len(numbers) % self._item_array_size:
+                return numpy.array(numbers, dtype=numpy.float64).reshape(-1, self._item_array_size)
 
-        if match:
             return [chunk for chunk in chunks(
-                        [float(_.groupdict()["number"]) for _ in match],
+                        [float(_) for _ in numbers],
                         self._item_array_size
                         )
                     ]
@@ -78,7 +122,7 @@ class TwoDimensionalNumberArrayType(object):
         return string
 
 
-class KeyValueType(object):
+class KeyValueType(BaseType):
 
     def __init__(self, pattern, key_type=str, value_type=str, prefix_pattern=""):
         """ given a string the class will generate a dictionary with declared key and value types
@@ -95,6 +139,9 @@ class KeyValueType(object):
                                   Allows you to extract a specific part of the string and prefix the found 'key' matches
                                   This is only supported if key_type is str
 
+        Raises:
+            TypeAssumptionError: if the patterns miss their named capturing groups
+
         Examples:
             >>> input_string = "transmission      samples  2 / depth  2"
             >>> convert =  KeyValueType(r"(?P<key>\w+)\s+(?P<value>\d+)", value_type=int, prefix_pattern=r"(?P<key>^\w+\s)")
@@ -107,6 +154,20 @@ class KeyValueType(object):
         self._value_type = value_type
         self._pattern = pattern
         self._prefix_pattern = prefix_pattern
+        self._regex = re.compile(pattern)
+        self._prefix_regex = re.compile(prefix_pattern) if prefix_pattern else None
+
+        # validate proper usage
+        if not {"key", "value"}.issubset(self._regex.groupindex):
+            raise TypeAssumptionError("{} needs ".format(self.__class__.__name__) +
+                                      "a 'key' and 'value' named capturing group."
+                                      )
+        if self._prefix_regex is not None:
+            if "key" not in self._prefix_regex.groupindex:
+                raise TypeAssumptionError("{} prefix pattern needs ".format(self.__class__.__name__) +
+                                          "a 'key' named capturing group."
+                                          )
+            assert self._key_type is str, "Prefix support only for string instances"
 
     def __call__(self, string):
         """ converts the original value
@@ -118,49 +179,37 @@ class KeyValueType(object):
             dict: included key value pair
 
         """
+        value_type = self._value_type
 
-        # validate proper usage
-        if not ("?P<key>" or "?P<value>") in self._pattern:
-            raise TypeAssumptionError("{} needs ".format(self.__class__.__name__) +
-                                      "a 'key' and 'value' named capturing group."
-                                      )
-        if self._prefix_pattern and "?P<key>" not in self._prefix_pattern:
-            raise TypeAssumptionError("{} prefix pattern needs ".format(self.__class__.__name__) +
-                                      "a 'key' named capturing group."
-                                      )
-
-        # lets find the prefix
-        if self._prefix_pattern:
-            match = re.search(self._prefix_pattern, string)
+        if self._prefix_regex is not None:
+            # lets find the prefix
+            match = self._prefix_regex.search(string)
             if not match:
                 raise TypeAssumptionError("No prefix match using '{0}' found in '{1}'.".format(self._prefix_pattern, string))
-            key_prefix = match.groupdict().get("key", None)
+            key_prefix = match.group("key")
 
-        if self._prefix_pattern:
             # lets apply the prefix to all 'key' founds
-            match = [_ for _ in re.finditer(self._pattern, string)]
-            if match:
-                match = [_.groupdict() for _ in match]
-                if self._prefix_pattern:
-                    assert self._key_type is str, "Prefix support only for string instances"
-                    return {key_prefix + _["key"]: self._value_type(_["value"]) for _ in match}
-
-                return {string: ""}
+            converted = {key_prefix + _.group("key"): value_type(_.group("value")) for _ in self._regex.finditer(string)}
+            if converted:
+                return converted
         else:
             # lets assume we have unique keys and values
-            match = re.search(self._pattern, string)
+            match = self._regex.search(string)
             if match:
-                return {self._key_type(match.groupdict()["key"]): self._value_type(match.groupdict()["value"])}
+                return {self._key_type(match.group("key")): value_type(match.group("value"))}
 
         return {string: ""}
 
 
-class NoneType(object):
+class NoneType(BaseType):
     """ Lets make None a callable which always converts to None """
 
     def __call__(self, string):
         return None
 
+    def convert_many(self, strings):
+        return [None] * len(strings)
+
 
 class BaseAssumptions(object):
     """ A simple rule: action store that allows inhering another stores
@@ -176,18 +225,25 @@ class BaseAssumptions(object):
             self._parent_assumptions = {}
         else:
             self._parent_assumptions = parent_assumptions
+        self._compiled = None
 
     @property
     def inherits(self):
         return self._inherits
 
+    def _compiled_assumptions(self):
+        """ compiled (regex, action) tuples, created once on first use and reused for all values """
+        if self._compiled is None:
+            self._compiled = [(re.compile(pattern), action) for pattern, action in self.get().items()]
+        return self._compiled
+
     def call_action(self, value):
         """ Calls expected action for when there is an assumed pattern match """
         if not isinstance(value, str):
             raise TypeAssumptionError("Value has to be of type 'str'.")
         results = []
-        for pattern, action in self.get().items():
-            if re.match(pattern, value):
+        for regex, action in self._compiled_assumptions():
+            if regex.match(value):
                 if results:
                     raise TypeAssumptionError("Multiple assumptions matching on value {}".format(value))
                 results.append(action(value))
@@ -196,6 +252,31 @@ class BaseAssumptions(object):
         else:
             return value
 
+    def call_action_many(self, values):
+        """ Calls expected actions for multiple values, values sharing an action get converted at once """
+        assumptions = self._compiled_assumptions()
+        results = list(values)
+        grouped = OrderedDict()
+        for i, value in enumerate(values):
+            if not isinstance(value, str):
+                raise TypeAssumptionError("Value has to be of type 'str'.")
+            actions = [action for regex, action in assumptions if regex.match(value)]
+            if len(actions) > 1:
+                raise TypeAssumptionError("Multiple assumptions matching on value {}".format(value))
+            if actions:
+                # custom types may be unhashable, so they get grouped by identity
+                grouped.setdefault(id(actions[0]), (actions[0], []))[1].append(i)
+
+        for action, indices in grouped.values():
+            convert_many = getattr(action, "convert_many", None)
+            if convert_many is not None:
+                converted = convert_many([values[i] for i in indices])
+            else:
+                converted = [action(values[i]) for i in indices]
+            for i, result in zip(indices, converted):
+                results[i] = result
+        return results
+
     def get(self):
         """ If the Assumption will inherit parent assumptions add them and get the updated result """
         _assumptions = self._parent_assumptions
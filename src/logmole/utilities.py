@@ -1,4 +1,125 @@
+from collections import OrderedDict
+import os
+import re
+
+# strings longer than this are never considered as path
+MAX_PATH_LENGTH = 4096
+LINE_CHUNK_SIZE = 1 << 16
+
+_BYTES_NEWLINE = re.compile(b"\n")
+
+
 def chunks(iterable, n):
     """ Yield successive n-sized chunks from an iterable."""
     for i in range(0, len(iterable), n):
         yield iterable[i:i + n]
+
+
+def is_content(source):
+    """ True if a str or bytes source can't be a path, so no filesystem lookup is needed."""
+    if len(source) > MAX_PATH_LENGTH:
+        return True
+    return (b"\n" if isinstance(source, (bytes, bytearray)) else "\n") in source
+
+
+def iter_path_lines(path, encoding=None):
+    """ Yield the lines of a file."""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            yield line
+
+
+def iter_file_lines(f, encoding="utf-8"):
+    """ Yield the lines of a text or binary file object, lines of binary files get decoded."""
+    for line in f:
+        yield decode_line(line, encoding) if isinstance(line, bytes) else line
+
+
+def iter_string_lines(string, chunk_size=LINE_CHUNK_SIZE):
+    """ Yield the same lines as str.splitlines(), but only split one chunk of lines at a time.
+
+    Chunks always end right after a newline found using str.find(), so no line ending gets split.
+    """
+    start, size = 0, len(string)
+    while start < size:
+        end = string.find("\n", start + chunk_size)
+        end = size if end == -1 else end + 1
+        for line in string[start:end].splitlines():
+            yield line
+        start = end
+
+
+def iter_bytes_lines(data, encoding="utf-8", chunk_size=LINE_CHUNK_SIZE):
+    """ Yield the decoded lines of bytes like iter_string_lines(), decoding only one chunk of lines at a time.
+
+    Chunks are decoded from a memoryview, so the data doesn't get copied before decoding.
+    """
+    view = memoryview(data).cast("B")
+    if "\n".encode(encoding) != b"\n":
+        # newlines can't be found bytewise in encodings like utf-16
+        for line in iter_string_lines(str(view, encoding), chunk_size=chunk_size):
+            yield line
+        return
+
+    start, size = 0, len(view)
+    while start < size:
+        match = _BYTES_NEWLINE.search(view, start + chunk_size)
+        end = size if match is None else match.end()
+        for line in str(view[start:end], encoding).splitlines():
+            yield line
+        start = end
+
+
+def iter_lines(file, encoding="utf-8"):
+    """ Yield the lines of a path, file object, str or bytes content or of an iterable of lines.
+
+    Strings and bytes are only considered as path if they could be one and the path exists.
+    """
+    if isinstance(file, (str, bytes, bytearray)):
+        if not is_content(file) and os.path.exists(file):
+            return iter_path_lines(file)
+        if isinstance(file, str):
+            return iter_string_lines(file)
+        return iter_bytes_lines(file, encoding)
+    if isinstance(file, memoryview):
+        return iter_bytes_lines(file, encoding)
+    if isinstance(file, os.PathLike):
+        return iter_path_lines(file)
+    if hasattr(file, "read"):
+        return iter_file_lines(file, encoding)
+    return iter(file)
+
+
+def iter_lines_with_offsets(f, start=0, end=None):
+    """ Yield (byte offset, raw line) tuples of a binary file from start until a line starts at or after end."""
+    f.seek(start)
+    offset = start
+    for raw in iter(f.readline, b""):
+        if end is not None and offset >= end:
+            break
+        yield offset, raw
+        offset += len(raw)
+
+
+def decode_line(raw, encoding="utf-8"):
+    """ Decode a raw line and translate its line ending like text mode files do."""
+    line = raw.decode(encoding)
+    if line.endswith("\r\n"):
+        return line[:-2] + "\n"
+    return line
+
+
+def member_tree(members):
+    """ Create a sorted nested dictionary from (dot separated member name, value) tuples."""
+    tree = OrderedDict()
+
+    # create a nested dictionary representing all added members
+    for member_name, value in sorted(members, key=lambda member: member[0]):
+        t = tree
+        parts = member_name.split(".")
+        for i, part in enumerate(parts):
+            if (i + 1) == len(parts):
+                t = t.setdefault(part, value)
+            else:
+                t = t.setdefault(part, {})
+    return tree
@@ -1,7 +1,9 @@
 from ...src.logmole import LogContainer
 from ...src.logmole import (
     TypeAssumptions,
-    KeyValueType
+    KeyValueType,
+    TimeType,
+    TwoDimensionalNumberArrayType
 )
 
 
@@ -67,4 +69,72 @@ class MultiMatchToDictContainer(LogContainer):
     assumptions = TypeAssumptions({".*": KeyValueType(r"(?P<key>.*):\s(?P<value>.*)")})
 
 
+class NumbersContainer(LogContainer):
+    pattern = r"(?P<number>\d+)"
 
+
+class BoundsContainer(LogContainer):
+    pattern = r"bounds:\s(?P<bounds>.*)"
+    assumptions = TypeAssumptions({r"^\(": TwoDimensionalNumberArrayType(r"(?P<number>-?\d+\.\d+)", item_array_size=3)})
+    representative = "scene"
+
+
+class TimesContainer(LogContainer):
+    pattern = r"(?P<start>\d+:\d+:\d+) started|(?P<end>\d+:\d+:\d+) ends"
+    assumptions = TypeAssumptions({".*": TimeType()})
+    representative = "times"
+
+
+class SceneContainer(LogContainer):
+    sub_containers = [BoundsContainer,
+                      TimesContainer,
+                      MultiMatchToDictContainer,
+                      NumbersContainer]
+
+
+class CoupleContainer(LogContainer):
+    pattern = r"mother:\s(?P<mother>\w+)\nfather:\s(?P<father>\w+)"
+    span = 2
+    representative = "couple"
+
+
+class SiblingsContainer(LogContainer):
+    pattern = r"child\d:\s(?P<elder>\w+)\nchild\d:\s(?P<younger>\w+)"
+    span = 2
+    representative = "siblings"
+
+
+class FamilyContainer(LogContainer):
+    sub_containers = [CoupleContainer,
+                      SiblingsContainer,
+                      Child1Container]
+
+
+class InvalidSpanContainer(LogContainer):
+    pattern = r"mother:\s(?P<mother>\w+)"
+    span = 0
+
+
+class ArrayBoundsContainer(LogContainer):
+    pattern = r"bounds:\s(?P<bounds>\([^)]*\))"
+    assumptions = TypeAssumptions({r"^\(": TwoDimensionalNumberArrayType(r"(?P<number>-?\d+\.\d+)",
+                                                                       item_array_size=3, as_array=True)})
+
+
+class NoInferArrayBoundsContainer(ArrayBoundsContainer):
+    infer_type = False
+
+
+class UpperType(object):
+    """ custom type that is unhashable, because it defines __eq__ without __hash__ """
+
+    def __eq__(self, other):
+        return isinstance(other, UpperType)
+
+    def __call__(self, string):
+        return string.upper()
+
+
+class UpperContainer(LogContainer):
+    pattern = r"w=(?P<word>\w+)"
+    assumptions = TypeAssumptions({r"^[a-z]+$": UpperType()})
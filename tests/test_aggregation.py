@@ -0,0 +1,128 @@
+import datetime
+import io
+import pickle
+import random
+from unittest import TestCase
+
+from ..src.logmole.aggregation import (
+    Aggregator,
+    DistinctCounter,
+    MemberStatistics,
+    QuantileSketch
+)
+
+from .fixtures import containers
+
+
+class TestQuantileSketch(TestCase):
+
+    def test_quantile(self):
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        self.assertIsNone(sketch.quantile(0.5))
+
+        rand = random.Random(0)
+        values = [rand.uniform(-1000, 1000) for _ in range(10000)] + [0] * 10
+        for value in values:
+            sketch.add(value)
+        values.sort()
+        for q in (0, 0.1, 0.5, 0.9, 0.99, 1):
+            expected = values[int(q * (len(values) - 1))]
+            self.assertAlmostEqual(sketch.quantile(q), expected, delta=abs(expected) * 0.01 + 1e-9)
+
+        with self.assertRaises(ValueError):
+            sketch.quantile(2)
+
+    def test_merge_and_bounds(self):
+        a, b, combined = QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64), QuantileSketch(max_buckets=64)
+        for value in range(1, 5001):
+            (a if value % 2 else b).add(value)
+            combined.add(value)
+        a.merge(b)
+        self.assertEqual(a.count, 5000)
+        self.assertLessEqual(len(a._positive), 64)
+        # collapsing keeps the higher quantiles accurate
+        self.assertAlmostEqual(a.quantile(0.99), combined.quantile(0.99))
+        self.assertAlmostEqual(a.quantile(0.99), 4950, delta=50)
+
+        with self.assertRaises(ValueError):
+            a.merge(QuantileSketch(relative_accuracy=0.1))
+
+
+class TestDistinctCounter(TestCase):
+
+    def test_estimate(self):
+        counter = DistinctCounter()
+        self.assertEqual(counter.estimate(), 0)
+        for i in range(20000):
+            counter.add("host-{}".format(i % 5000))
+        self.assertAlmostEqual(counter.estimate(), 5000, delta=250)
+
+        other = DistinctCounter()
+        for i in range(5000, 10000):
+            other.add("host-{}".format(i))
+        counter.merge(other)
+        self.assertAlmostEqual(counter.estimate(), 10000, delta=500)
+
+
+class TestMemberStatistics(TestCase):
+
+    def test_update_and_merge(self):
+        a, b = MemberStatistics(), MemberStatistics()
+        for value in [1, 2, [3, 4], None, "foo"]:
+            a.update(value)
+        for value in [datetime.time(0, 0, 10), 5.0, True]:
+            b.update(value)
+
+        self.assertEqual(a.count, 5)
+        self.assertEqual(a.numeric_count, 4)
+        self.assertEqual(a.mean, 2.5)
+
+        a.merge(b)
+        self.assertEqual(a.count, 8)
+        self.assertEqual(a.numeric_count, 6)
+        self.assertEqual(a.min, 1)
+        self.assertEqual(a.max, 10)
+        self.assertAlmostEqual(a.mean, 25 / 6.0)
+        self.assertAlmostEqual(a.variance, 10.1666667, places=5)
+
+        summary = a.summary()
+        self.assertEqual(summary["distinct"], 8)
+        self.assertAlmostEqual(summary["p50"], 3, delta=0.03)
+
+
+class TestAggregator(TestCase):
+
+    def test_aggregate(self):
+        logs = ["{0} {1}".format(i, i * 2) for i in range(1, 101)]
+
+        aggregator = Aggregator(containers.NumbersContainer)
+        aggregator.update_many(logs[:50])
+
+        worker = pickle.loads(pickle.dumps(Aggregator(containers.NumbersContainer)))
+        worker.update_many(containers.NumbersContainer(log).compact() for log in logs[50:])
+        aggregator.merge(worker)
+
+        self.assertEqual(aggregator.logs, 100)
+        self.assertListEqual(aggregator.members, ["number"])
+        summary = aggregator.summary()["number"]
+        self.assertEqual(summary["count"], 200)
+        self.assertEqual(summary["min"], 1)
+        self.assertEqual(summary["max"], 200)
+        self.assertAlmostEqual(summary["mean"], 75.75)
+        self.assertAlmostEqual(aggregator["number"].quantile(0.5), 67, delta=1)
+
+    def test_update_many_sources(self):
+        aggregator = Aggregator(containers.NumbersContainer)
+        aggregator.update_many([b"1 2", io.StringIO("3\n4"), io.BytesIO(b"5"), ["6", "7 8"]])
+
+        self.assertEqual(aggregator.logs, 4)
+        summary = aggregator.summary()["number"]
+        self.assertEqual(summary["count"], 8)
+        self.assertEqual(summary["min"], 1)
+        self.assertEqual(summary["max"], 8)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            Aggregator(containers.ParentsContainer, members=["parents.foo"])
+        with self.assertRaises(ValueError):
+            Aggregator(containers.ParentsContainer).merge(Aggregator(containers.NumbersContainer))
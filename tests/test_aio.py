@@ -0,0 +1,108 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import threading
+from unittest import TestCase, mock
+
+from ..src.logmole.multiline import LineWindow
+
+from .fixtures import containers
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+async def collect(async_iterable):
+    return [_ async for _ in async_iterable]
+
+
+class TestAsyncParsing(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+        with open(cls._log, "r") as f:
+            cls._logstream = f.read()
+        cls._expected_tree = containers.ParentsContainer(cls._log)._tree
+
+    def test_aparse_path_and_string(self):
+        for file_or_stream in [self._log, self._logstream]:
+            x = run(containers.ParentsContainer.aparse(file_or_stream, chunk_size=7))
+            self.assertIsInstance(x, containers.ParentsContainer)
+            self.assertDictEqual(x._tree, self._expected_tree)
+            self.assertEqual(x.parents.mother, "Jane")
+
+    def test_aparse_stream_reader(self):
+        async def parse():
+            reader = asyncio.StreamReader()
+            reader.feed_data(self._logstream.replace("\n", "\r\n").encode("utf-8"))
+            reader.feed_eof()
+            return await containers.ParentsContainer.aparse(reader, chunk_size=5)
+
+        self.assertDictEqual(run(parse())._tree, self._expected_tree)
+
+    def test_aparse_async_iterable(self):
+        data = "child1: Jürgen\nchild2: Lea".encode("utf-8")
+
+        async def chunks():
+            # split inside the multibyte character and in between lines
+            for i in range(0, len(data), 3):
+                yield data[i:i + 3]
+
+        x = run(containers.ParentsContainer.aparse(chunks()))
+        self.assertEqual(x.get_value("children.child1.name"), "Jürgen")
+        self.assertEqual(x.get_value("children.child2.name"), "Lea")
+
+        with self.assertRaises(TypeError):
+            run(containers.ParentsContainer.aparse(5))
+
+    def test_aparse_many(self):
+        sources = [self._log, self._logstream, "mother: Anna"]
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = run(collect(containers.ParentsContainer.aparse_many(sources, executor=executor,
+                                                                          concurrency=2)))
+
+        self.assertEqual(len(results), 3)
+        self.assertSetEqual({_[0] for _ in results}, set(sources))
+        for source, container in results:
+            if source == "mother: Anna":
+                self.assertEqual(container.parents.mother, "Anna")
+                self.assertIsNone(container.parents.father)
+            else:
+                self.assertDictEqual(container._tree, self._expected_tree)
+
+        with self.assertRaises(ValueError):
+            run(collect(containers.ParentsContainer.aparse_many(sources, concurrency=0)))
+
+    def test_aparse_process_pool(self):
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            x = run(containers.ParentsContainer.aparse(self._log, executor=executor, chunk_size=7))
+            y = run(containers.FamilyContainer.aparse(self._logstream, executor=executor, chunk_size=7))
+
+        self.assertDictEqual(x._tree, self._expected_tree)
+        self.assertEqual(y.couple.father, "Peter")
+        self.assertEqual(y.child1.name, "Dave")
+
+    def test_aparse_multiline_in_executor(self):
+        threads = set()
+        push = LineWindow.push
+
+        def recording_push(window, line, tag=None):
+            threads.add(threading.current_thread())
+            return push(window, line, tag)
+
+        with mock.patch.object(LineWindow, "push", recording_push):
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                x = run(containers.CoupleContainer.aparse(self._logstream, executor=executor, chunk_size=7))
+
+        # the container only has a multiline pattern, still no matching happens in the event loop
+        self.assertEqual(x.regex, "")
+        self.assertEqual(x.mother, "Jane")
+        self.assertEqual(x.father, "Peter")
+        self.assertTrue(threads)
+        self.assertNotIn(threading.main_thread(), threads)
@@ -0,0 +1,54 @@
+import os
+import pickle
+from unittest import TestCase
+
+from ..src.logmole.compact import (
+    CompactResult,
+    compact_schema
+)
+
+from .fixtures import containers
+
+
+class TestCompactResult(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+
+    def test_schema(self):
+        schema = compact_schema(containers.ParentsContainer)
+        self.assertIs(schema, compact_schema(containers.ParentsContainer))
+        self.assertTupleEqual(schema.member_names,
+                              ("children.child1.name", "children.child2.name", "parents.father", "parents.mother"))
+        self.assertEqual(schema.member_ids["parents.father"], 2)
+
+    def test_members(self):
+        container = containers.ParentsContainer(self._log)
+        x = container.compact()
+        y = containers.ParentsContainer(self._log).compact()
+
+        self.assertIsInstance(x, CompactResult)
+        self.assertIs(type(x), type(y))
+        self.assertIs(type(x.children), type(y.children))
+        self.assertFalse(hasattr(x, "__dict__"))
+        self.assertFalse(hasattr(x.parents, "__dict__"))
+
+        self.assertEqual(x.parents.father, "Peter")
+        self.assertEqual(x.parents.mother, "Jane")
+        self.assertEqual(x.children.child1.name, "Dave")
+        self.assertEqual(x.children.child2.name, "Lea")
+        self.assertListEqual(x._values, ["Dave", "Lea", "Peter", "Jane"])
+
+        self.assertEqual(x.get_value("parents.father"), "Peter")
+        self.assertIsNone(x.get_value("mother"))
+        self.assertEqual(x.get_value("parents", default=6), 6)
+
+        self.assertDictEqual(x.to_tree(), container._tree)
+        self.assertEqual(repr(x), repr(container))
+
+    def test_pickle(self):
+        x = containers.MultiMatchContainer(self._log).compact()
+        y = pickle.loads(pickle.dumps(x))
+        self.assertIs(type(x), type(y))
+        self.assertListEqual(sorted(y.family), ["Dave", "Jane", "Lea", "Peter"])
@@ -0,0 +1,46 @@
+import os
+import re
+from unittest import TestCase
+
+from ..src.logmole import CompositeParser
+
+from .fixtures import containers
+
+
+class TestCompositeParser(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+        with open(cls._log, "r") as f:
+            cls._logstream = f.read()
+        cls._containers = [
+            containers.ParentsContainer,
+            containers.MultiMatchContainer,
+            containers.MultiMatchToDictContainer
+        ]
+
+    def test_requires_containers(self):
+        with self.assertRaises(ValueError):
+            CompositeParser()
+
+    def test_namespaced_regex(self):
+        parser = CompositeParser(*self._containers)
+        # both multi match containers use a 'family' group on the same named container class
+        group_names = re.compile(parser.regex).groupindex
+        self.assertIn("s1_MultiMatchContainer_family", group_names)
+        self.assertIn("s2_MultiMatchToDictContainer_family", group_names)
+        self.assertIn("s0_MotherContainer_mother", group_names)
+
+    def test_parse(self):
+        parser = CompositeParser(*self._containers)
+        for file_or_stream in [self._log, self._logstream]:
+            results = parser.parse(file_or_stream)
+            self.assertEqual(len(results), len(self._containers))
+            for container, result in zip(self._containers, results):
+                self.assertIsInstance(result, container)
+                self.assertEqual(result._tree, container(file_or_stream)._tree)
+
+        parents, multi_match, _ = parser.parse(self._log)
+        self.assertEqual(parents.get_value("children.child2.name"), "Lea")
+        self.assertListEqual(sorted(multi_match.family), ["Dave", "Jane", "Lea", "Peter"])
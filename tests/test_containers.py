@@ -3,9 +3,11 @@ import json
 import os
 import tempfile
 import uuid
-from unittest import TestCase
+from unittest import TestCase, mock, skipIf
 
 from ..src.logmole import LogContainer
+from ..src.logmole import utilities
+from ..src.logmole import types as logmole_types
 
 from .fixtures import containers
 
@@ -153,3 +155,70 @@ class TestContainer(TestCase):
                                         'father': 'Peter',
                                         'mother': 'Jane'}
                              )
+
+    def test_multi_match_per_line(self):
+        x = containers.NumbersContainer("4 1 2\n2 3")
+        self.assertListEqual(x.number, [1, 2, 3, 4])
+
+    def test_constructors(self):
+        with open(self._log, "rb") as f:
+            data = f.read().replace(b"\n", b"\r\n")
+
+        for x in [containers.ParentsContainer.from_path(self._log),
+                  containers.ParentsContainer.from_string(self._logstream),
+                  containers.ParentsContainer.from_bytes(data),
+                  containers.ParentsContainer.from_bytes(memoryview(data)),
+                  containers.ParentsContainer.from_lines(self._logstream.split("\n")),
+                  containers.ParentsContainer(data),
+                  containers.ParentsContainer(iter(self._logstream.split("\n")))]:
+            self.assertDictEqual(x._tree, self._expected_dict)
+
+        for mode in ["r", "rb"]:
+            with open(self._log, mode) as f:
+                self.assertDictEqual(containers.ParentsContainer.from_file(f)._tree, self._expected_dict)
+            with open(self._log, mode) as f:
+                self.assertDictEqual(containers.ParentsContainer(f)._tree, self._expected_dict)
+
+    def test_content_detection(self):
+        with mock.patch.object(utilities.os.path, "exists", return_value=False) as exists:
+            containers.ParentsContainer(self._logstream)
+            containers.ParentsContainer("mother: Jane" * 1000)
+            containers.ParentsContainer.from_string("mother: Jane")
+            self.assertFalse(exists.called)
+            self.assertEqual(containers.ParentsContainer("mother: Jane").parents.mother, "Jane")
+            self.assertTrue(exists.called)
+
+    def test_line_scanners(self):
+        content = "a\r\nb\rc\n\nd\x0ce\r\n" + "f" * 10 + "\ng"
+        for chunk_size in range(1, 8):
+            self.assertListEqual(list(utilities.iter_string_lines(content, chunk_size=chunk_size)),
+                                 content.splitlines())
+            for encoding in ["utf-8", "utf-16"]:
+                self.assertListEqual(list(utilities.iter_bytes_lines(content.encode(encoding), encoding=encoding,
+                                                                     chunk_size=chunk_size)),
+                                     content.splitlines())
+        self.assertListEqual(list(utilities.iter_string_lines("")), [])
+
+    @skipIf(logmole_types.numpy is None, "numpy is not available")
+    def test_array_values(self):
+        numpy = logmole_types.numpy
+
+        x = containers.ArrayBoundsContainer("bounds: (1.0, 2.0, 3.0)")
+        self.assertIsInstance(x.bounds, numpy.ndarray)
+        self.assertListEqual(x.bounds.tolist(), [[1.0, 2.0, 3.0]])
+
+        # multiple matches on separate lines and within a single line
+        for content in ["bounds: (1.0, 2.0, 3.0)\nbounds: (4.0, 5.0, 6.0)\nbounds: (7.0, 8.0, 9.0)",
+                        "bounds: (1.0, 2.0, 3.0) bounds: (4.0, 5.0, 6.0)\nbounds: (7.0, 8.0, 9.0)"]:
+            x = containers.ArrayBoundsContainer(content)
+            self.assertIsInstance(x.bounds, list)
+            self.assertListEqual([_.tolist() for _ in x.bounds],
+                                 [[[1.0, 2.0, 3.0]], [[4.0, 5.0, 6.0]], [[7.0, 8.0, 9.0]]])
+
+        x = containers.NoInferArrayBoundsContainer("bounds: (1.0, 2.0, 3.0) bounds: (4.0, 5.0, 6.0)\n"
+                                                   "bounds: (7.0, 8.0, 9.0)")
+        self.assertListEqual(sorted(x.bounds), ["(1.0, 2.0, 3.0)", "(4.0, 5.0, 6.0)", "(7.0, 8.0, 9.0)"])
+
+    def test_unhashable_type(self):
+        self.assertEqual(containers.UpperContainer("w=abc").word, "ABC")
+        self.assertListEqual(sorted(containers.UpperContainer("w=abc w=def").word), ["ABC", "DEF"])
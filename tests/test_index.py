@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from ..src.logmole.index import (
+    LogIndex,
+    LogIndexError,
+    schema_fingerprint
+)
+
+from .fixtures import containers
+
+
+class TestLogIndex(TestCase):
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+        self._log = os.path.join(self._tempdir, "log")
+        shutil.copy(os.path.join(os.path.dirname(containers.__file__), "log"), self._log)
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def test_fingerprint(self):
+        self.assertEqual(schema_fingerprint(containers.ParentsContainer),
+                         schema_fingerprint(containers.ParentsContainer(self._log)))
+        self.assertNotEqual(schema_fingerprint(containers.ParentsContainer),
+                            schema_fingerprint(containers.MultiMatchContainer))
+
+    def test_build(self):
+        container, index = LogIndex.build(containers.ParentsContainer, self._log)
+
+        self.assertDictEqual(container._tree, containers.ParentsContainer(self._log)._tree)
+        self.assertTrue(os.path.exists(self._log + ".lmidx"))
+        self.assertListEqual(index.members,
+                             ["children.child1.name", "children.child2.name", "parents.father", "parents.mother"])
+        self.assertListEqual(list(index.line_numbers("parents.father")), [2])
+        self.assertListEqual(list(index.offsets("parents.father")), [13])
+        self.assertListEqual(list(index.lines("children.child2.name")), [(4, "child2: Lea")])
+        self.assertListEqual(list(index.lines("parents")), [])
+
+    def test_load(self):
+        _, built = LogIndex.build(containers.MultiMatchContainer, self._log)
+        loaded = LogIndex.load(containers.MultiMatchContainer, self._log)
+
+        self.assertListEqual(loaded.members, ["family"])
+        self.assertListEqual(list(loaded.offsets("family")), list(built.offsets("family")))
+        self.assertListEqual(list(loaded.line_numbers("family")), [1, 2, 3, 4])
+
+        with self.assertRaises(LogIndexError):
+            LogIndex.load(containers.ParentsContainer, self._log)
+
+        with open(self._log, "a") as f:
+            f.write("\nmother: Anna")
+        with self.assertRaises(LogIndexError):
+            LogIndex.load(containers.MultiMatchContainer, self._log)
+
+        rebuilt = LogIndex.load_or_build(containers.MultiMatchContainer, self._log)
+        self.assertListEqual(list(rebuilt.line_numbers("family")), [1, 2, 3, 4, 5])
+        self.assertListEqual(list(LogIndex.load(containers.MultiMatchContainer, self._log).line_numbers("family")),
+                             [1, 2, 3, 4, 5])
+
+    def test_load_invalid(self):
+        with open(self._log + ".lmidx", "wb") as f:
+            f.write(b"LMIX")
+        with self.assertRaises(LogIndexError):
+            LogIndex.load(containers.ParentsContainer, self._log)
+
+    def test_load_rewritten_log(self):
+        LogIndex.build(containers.ParentsContainer, self._log)
+        stat = os.stat(self._log)
+
+        # same size and a modification time within the same second
+        with open(self._log, "r+") as f:
+            f.write("foo: 12345678")
+        os.utime(self._log, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+        self.assertEqual(os.path.getsize(self._log), stat.st_size)
+        with self.assertRaises(LogIndexError):
+            LogIndex.load(containers.ParentsContainer, self._log)
+
+        # replaced log with the exact same size and modification time
+        LogIndex.build(containers.ParentsContainer, self._log)
+        stat = os.stat(self._log)
+        replacement = self._log + ".tmp"
+        shutil.copy(self._log, replacement)
+        os.utime(replacement, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        os.replace(replacement, self._log)
+        with self.assertRaises(LogIndexError):
+            LogIndex.load(containers.ParentsContainer, self._log)
+
+    def test_build_growing_log(self):
+        stat = os.stat(self._log)
+
+        def fstat(size):
+            # the log had the given size when it was opened
+            return os.stat_result(tuple(stat)[:6] + (size, ) + tuple(stat)[7:],
+                                  {_: getattr(stat, _) for _ in ("st_atime_ns", "st_mtime_ns", "st_ctime_ns")})
+
+        for size, members in [(27, ["parents.father", "parents.mother"]),
+                              (36, ["children.child1.name", "parents.father", "parents.mother"])]:
+            with mock.patch.object(os, "fstat", return_value=fstat(size)):
+                container, index = LogIndex.build(containers.ParentsContainer, self._log)
+
+            self.assertListEqual(index.members, members)
+            self.assertIsNone(container.children.child2.name)
+            # the bytes that weren't indexed make the index outdated
+            with self.assertRaises(LogIndexError):
+                LogIndex.load(containers.ParentsContainer, self._log)
+
+        # 36 bytes cut the third line off after 'child1: D'
+        self.assertEqual(container.children.child1.name, "D")
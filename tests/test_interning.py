@@ -0,0 +1,64 @@
+import os
+from unittest import TestCase
+
+from ..src.logmole import StringPool
+
+from .fixtures import containers
+
+
+def unique(string):
+    # create an equal but not identical string
+    return "".join(list(string))
+
+
+class TestStringPool(TestCase):
+
+    def test_intern(self):
+        pool = StringPool(maxsize=2)
+        a = pool.intern(unique("alpha"))
+        self.assertIs(pool.intern(unique("alpha")), a)
+        self.assertEqual(pool.stats()["hits"], 1)
+        self.assertEqual(pool.stats()["misses"], 1)
+        self.assertGreater(pool.saved_bytes, 0)
+
+        pool.intern("beta")
+        # the pool is full, new strings will be returned but not pooled
+        gamma = unique("gamma")
+        self.assertIs(pool.intern(gamma), gamma)
+        self.assertNotIn("gamma", pool)
+        self.assertEqual(len(pool), 2)
+
+        pool.clear()
+        self.assertDictEqual(pool.stats(), {"size": 0, "maxsize": 2, "hits": 0, "misses": 0, "saved_bytes": 0})
+
+    def test_intern_value(self):
+        pool = StringPool()
+        key, value = pool.intern("key"), pool.intern("value")
+        interned = pool.intern_value({unique("key"): unique("value"), 1: 2.0})
+        self.assertDictEqual(interned, {"key": "value", 1: 2.0})
+        self.assertIs([_ for _ in interned if _ == "key"][0], key)
+        self.assertIs(interned["key"], value)
+        self.assertEqual(pool.intern_value(5), 5)
+
+
+class TestContainerInterning(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+
+    def test_container_pool(self):
+        pool = StringPool()
+        pooled = type("PooledContainer", (containers.ParentsContainer, ), {"string_pool": pool})
+        x = pooled(self._log)
+        y = pooled(self._log)
+        self.assertDictEqual(x._tree, containers.ParentsContainer(self._log)._tree)
+        self.assertIs(x.parents.father, y.parents.father)
+        self.assertIs(x.children.child1.name, y.children.child1.name)
+        self.assertEqual(pool.hits, 4)
+
+        pooled = type("PooledContainer", (containers.MultiMatchToDictContainer, ), {"string_pool": pool})
+        x = pooled(self._log)
+        y = pooled(self._log)
+        self.assertIs(x.family["father"], y.family["father"])
+        self.assertIs(x.family["father"], pool.intern("Peter"))
@@ -0,0 +1,95 @@
+import asyncio
+import os
+import re
+import shutil
+import tempfile
+from unittest import TestCase
+
+from ..src.logmole import CompositeParser, LogIndex
+from ..src.logmole.multiline import LineWindow
+
+from .fixtures import containers
+
+
+class TestLineWindow(TestCase):
+
+    def _match(self, lines, pattern, span):
+        window = LineWindow([(re.compile(pattern), span)])
+        found = []
+        for i, line in enumerate(lines):
+            found.extend(window.push(line, i))
+        found.extend(window.flush())
+        return [(tag, match.group(0)) for tag, match in found]
+
+    def test_matches_across_lines(self):
+        self.assertListEqual(self._match(["a", "b", "c", "a", "b"], r"a\nb", 2),
+                             [(0, "a\nb"), (3, "a\nb")])
+
+    def test_no_overlapping_matches(self):
+        self.assertListEqual(self._match(["x1", "x2", "x3", "x4", "x5"], r"x\d\nx\d", 2),
+                             [(0, "x1\nx2"), (2, "x3\nx4")])
+
+    def test_span_limit(self):
+        self.assertListEqual(self._match(["a", "b", "c"], r"a\nb\nc", 2), [])
+        self.assertListEqual(self._match(["a", "b", "c"], r"a\nb\nc", 3), [(0, "a\nb\nc")])
+
+    def test_bounded_buffer(self):
+        window = LineWindow([(re.compile(r"a\nb"), 3)])
+        for _ in range(100):
+            window.push("line")
+        self.assertEqual(len(window._lines), 3)
+
+
+class TestMultilineContainers(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+        with open(cls._log, "r") as f:
+            cls._logstream = f.read()
+
+    def _assert_family(self, x):
+        self.assertEqual(x.couple.mother, "Jane")
+        self.assertEqual(x.couple.father, "Peter")
+        self.assertEqual(x.siblings.elder, "Dave")
+        self.assertEqual(x.siblings.younger, "Lea")
+        self.assertEqual(x.child1.name, "Dave")
+
+    def test_parse(self):
+        for file_or_stream in [self._log, self._logstream]:
+            x = containers.FamilyContainer(file_or_stream)
+            self._assert_family(x)
+            self.assertNotIn("mother", x.regex)
+
+    def test_invalid_span(self):
+        with self.assertRaises(ValueError):
+            containers.InvalidSpanContainer(self._log)
+
+    def test_aparse(self):
+        loop = asyncio.new_event_loop()
+        try:
+            x = loop.run_until_complete(containers.FamilyContainer.aparse(self._logstream, chunk_size=5))
+        finally:
+            loop.close()
+        self._assert_family(x)
+
+    def test_composite(self):
+        family, parents = CompositeParser(containers.FamilyContainer, containers.ParentsContainer).parse(self._log)
+        self._assert_family(family)
+        self.assertDictEqual(parents._tree, containers.ParentsContainer(self._log)._tree)
+
+    def test_index_and_ranges(self):
+        tempdir = tempfile.mkdtemp()
+        try:
+            log = os.path.join(tempdir, "log")
+            shutil.copy(self._log, log)
+            x, index = LogIndex.build(containers.FamilyContainer, log)
+            self._assert_family(x)
+            self.assertListEqual(list(index.line_numbers("couple.father")), [1])
+            self.assertListEqual(list(index.line_numbers("siblings.younger")), [3])
+
+            x = containers.FamilyContainer.parse_range(log, end=26)
+            self.assertEqual(x.couple.father, "Peter")
+            self.assertIsNone(x.siblings.elder)
+        finally:
+            shutil.rmtree(tempdir)
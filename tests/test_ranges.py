@@ -0,0 +1,76 @@
+import os
+from unittest import TestCase
+
+from ..src.logmole.ranges import Region
+
+from .fixtures import containers
+
+
+class TestRegion(TestCase):
+
+    def test_resolve(self):
+        self.assertEqual(Region(2, 5).resolve(10), (2, 5))
+        self.assertEqual(Region.head(4).resolve(10), (0, 4))
+        self.assertEqual(Region.head(40).resolve(10), (0, 10))
+        self.assertEqual(Region.tail(4).resolve(10), (6, 10))
+        self.assertEqual(Region.tail(40).resolve(10), (0, 10))
+        self.assertEqual(Region.tail(0).resolve(10), (10, 10))
+        self.assertEqual(Region.tail(-3).resolve(10), (10, 10))
+        self.assertEqual(Region(8, 2).resolve(10), (8, 8))
+
+
+class TestParseRegions(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        # mother: Jane\nfather: Peter\nchild1: Dave\nchild2: Lea
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+
+    def test_parse_range(self):
+        # starts within the first line and stops within the second line
+        x = containers.ParentsContainer.parse_range(self._log, 3, 15)
+        self.assertIsNone(x.parents.mother)
+        self.assertEqual(x.parents.father, "Peter")
+        self.assertIsNone(x.children.child1.name)
+
+        # a partially covered line at the start is skipped
+        self.assertIsNone(containers.ParentsContainer.parse_range(self._log, -5).children.child2.name)
+
+        # tail
+        x = containers.ParentsContainer.parse_range(self._log, -11)
+        self.assertEqual(x._tree["children"]["child2"]["name"], "Lea")
+        self.assertIsNone(x.get_value("children.child1.name"))
+
+        # empty tail
+        x = containers.ParentsContainer.parse_regions(self._log, [Region.tail(0)])
+        self.assertListEqual([_ for _ in x._iter_members() if _[1] is not None], [])
+
+        # everything
+        self.assertDictEqual(containers.ParentsContainer.parse_range(self._log)._tree,
+                             containers.ParentsContainer(self._log)._tree)
+
+    def test_parse_regions(self):
+        x = containers.ParentsContainer.parse_regions(self._log, [
+            Region.head(1, containers=[containers.MotherContainer]),
+            Region.tail(24, containers=[containers.ChildrenContainer])
+        ])
+        self.assertEqual(x.parents.mother, "Jane")
+        self.assertIsNone(x.parents.father)
+        self.assertEqual(x.children.child1.name, "Dave")
+        self.assertEqual(x.children.child2.name, "Lea")
+
+    def test_overlapping_regions(self):
+        x = containers.MultiMatchContainer.parse_regions(self._log, [Region.head(30), Region.tail(50)])
+        self.assertListEqual(sorted(x.family), ["Dave", "Jane", "Lea", "Peter"])
+
+        x = containers.ParentsContainer.parse_regions(self._log, [
+            Region.head(30, containers=[containers.FatherContainer]),
+            Region.head(30, containers=[containers.MotherContainer])
+        ])
+        self.assertEqual(x.parents.mother, "Jane")
+        self.assertEqual(x.parents.father, "Peter")
+        self.assertIsNone(x.children.child1.name)
+
+    def test_invalid_container(self):
+        with self.assertRaises(ValueError):
+            containers.ParentsContainer.parse_range(self._log, containers=[containers.MultiMatchContainer])
@@ -0,0 +1,137 @@
+from datetime import time
+import io
+import json
+import os
+import shutil
+import tempfile
+from unittest import (
+    skipIf,
+    TestCase
+)
+
+from ..src.logmole.containers import json_default
+from ..src.logmole import serialization
+from ..src.logmole.serialization import (
+    iter_binary,
+    iter_json,
+    iter_ndjson,
+    write_binary,
+    write_ndjson
+)
+
+from .fixtures import containers
+
+
+SCENE_LOG = "\n".join([
+    "19:22:40 started",
+    "bounds: (1.0, -2.5, 3.0) (4.0, 5.0, 6.25)",
+    "mother: Jane",
+    "father: Peter",
+    "1 2 3",
+    "19:24:10 ends"
+])
+
+
+class TestSerialization(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls._log = os.path.join(os.path.dirname(containers.__file__), "log")
+        cls._results = [
+            containers.ParentsContainer(cls._log),
+            containers.SceneContainer(SCENE_LOG),
+            containers.SceneContainer(SCENE_LOG).compact(),
+            containers.ParentsContainer(""),
+            containers.NumbersContainer("1 2 3"),
+            containers.NumbersContainer("1 300 70000 5000000000 %d" % (1 << 70))
+        ]
+
+    def setUp(self):
+        self._tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._tempdir)
+
+    def _tree(self, result):
+        return result.to_tree() if hasattr(result, "to_tree") else result._tree
+
+    def test_iter_json(self):
+        for result in self._results:
+            tree = self._tree(result)
+            self.assertEqual("".join(iter_json(result, indent=4)),
+                             json.dumps(tree, indent=4, sort_keys=True, default=json_default))
+            self.assertEqual("".join(iter_json(result, indent="\t")),
+                             json.dumps(tree, indent="\t", sort_keys=True, default=json_default))
+            self.assertEqual("".join(iter_json(result)),
+                             json.dumps(tree, sort_keys=True, separators=(",", ":"), default=json_default))
+
+    def test_ndjson(self):
+        stream = io.StringIO()
+        write_ndjson(self._results, stream)
+        self.assertEqual(len(stream.getvalue().splitlines()), len(self._results))
+
+        stream.seek(0)
+        loaded = list(iter_ndjson(stream))
+        expected = [json.loads(json.dumps(self._tree(_), default=json_default)) for _ in self._results]
+        self.assertListEqual(loaded, expected)
+
+    def test_binary(self):
+        stream = io.BytesIO()
+        write_binary(self._results, stream)
+
+        stream.seek(0)
+        loaded = list(iter_binary(stream))
+        self.assertListEqual(loaded, [self._tree(_) for _ in self._results])
+        self.assertEqual(loaded[1]["times"]["start"], time(19, 22, 40))
+        self.assertEqual(loaded[1]["scene"]["bounds"], [[1.0, -2.5, 3.0], [4.0, 5.0, 6.25]])
+
+        with self.assertRaises(ValueError):
+            list(iter_binary(io.BytesIO(b"JSON")))
+
+    @skipIf(serialization.numpy is None, "numpy is not available")
+    def test_binary_as_array(self):
+        stream = io.BytesIO()
+        write_binary(self._results[1:2], stream)
+        stream.seek(0)
+        bounds = list(iter_binary(stream, as_array=True))[0]["scene"]["bounds"]
+        self.assertIsInstance(bounds, serialization.numpy.ndarray)
+        self.assertEqual(bounds.tolist(), [[1.0, -2.5, 3.0], [4.0, 5.0, 6.25]])
+
+        stream = io.BytesIO()
+        write_binary([containers.SceneContainer(SCENE_LOG).compact()], stream)
+        self.assertEqual(stream.getvalue(), self._binary(self._results[1]))
+
+    def _binary(self, result):
+        stream = io.BytesIO()
+        write_binary([result], stream)
+        return stream.getvalue()
+
+    def test_dump_formats(self):
+        result = self._results[1]
+
+        path = os.path.join(self._tempdir, "log.ndjson")
+        result.dump(path, format="ndjson")
+        with open(path) as f:
+            self.assertListEqual(list(iter_ndjson(f)), [json.loads(json.dumps(result._tree, default=json_default))])
+
+        path = os.path.join(self._tempdir, "log.lmol")
+        result.dump(path, format="binary")
+        with open(path, "rb") as f:
+            self.assertListEqual(list(iter_binary(f)), [result._tree])
+
+        # unsupported json arguments fall back to dumping the tree
+        path = os.path.join(self._tempdir, "log.json")
+        result.dump(path, indent=None, separators=(",", ":"))
+        with open(path) as f:
+            self.assertEqual(f.read(), json.dumps(result._tree, sort_keys=True, separators=(",", ":"),
+                                                  default=json_default))
+
+        # indents are used like json does, also if they are strings
+        for indent in ["\t", "", 0, 2]:
+            result.dump(path, indent=indent)
+            with open(path) as f:
+                self.assertEqual(f.read(), json.dumps(result._tree, indent=indent, sort_keys=True,
+                                                      default=json_default))
+
+        with self.assertRaises(ValueError):
+            result.dump(path, format="yaml")
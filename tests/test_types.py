@@ -1,14 +1,17 @@
 from datetime import time
 from unittest import (
     mock,
+    skipIf,
     TestCase
 )
 
+from ..src.logmole import types as logmole_types
 from ..src.logmole import (
     KeyValueType,
     TimeType,
     TwoDimensionalNumberArrayType,
-    GenericAssumptions
+    GenericAssumptions,
+    TypeAssumptions
 )
 
 
@@ -34,6 +37,32 @@ class TestGenericAssumptions(TestCase):
         self.assertEqual(None, self._assumptions.call_action("NULL"))
         self.assertEqual("NUll", self._assumptions.call_action("NUll"))
 
+    def test_call_action_many(self):
+        self.assertListEqual([-2, 5.0, None, "NUll", 3], self._assumptions.call_action_many(["-2", "5.0", "nil", "NUll", "3"]))
+        with self.assertRaises(ValueError):
+            self._assumptions.call_action_many(["1", 2])
+
+        # assumptions get deep copied, so we record the batches on the class
+        class RecordingTimeType(TimeType):
+            batches = []
+
+            def convert_many(self, strings):
+                self.batches.append(strings)
+                return super(RecordingTimeType, self).convert_many(strings)
+
+        assumptions = TypeAssumptions({".*:": RecordingTimeType()}, self._assumptions.get())
+        self.assertListEqual([time(1, 2, 3), 5, time(4, 5, 6)],
+                             assumptions.call_action_many(["1:2:3", "5", "4:5:6"]))
+        self.assertListEqual([["1:2:3", "4:5:6"]], RecordingTimeType.batches)
+
+    def test_compiled_once(self):
+        assumptions = GenericAssumptions()
+        self.assertEqual(5, assumptions.call_action("5"))
+        with mock.patch.object(assumptions, "get") as get:
+            self.assertEqual(5.0, assumptions.call_action("5.0"))
+            self.assertListEqual([1, None], assumptions.call_action_many(["1", "nil"]))
+            self.assertFalse(get.called)
+
 
 class TestKeyValueType(TestCase):
 
@@ -50,12 +79,15 @@ class TestKeyValueType(TestCase):
             # default behaviour when there is no match
             self.assertEqual({"bc=5.0.0": ""}, self.key_value_type("bc=5.0.0"))
 
-    def test_call_invalid_pattern(self):
-        with mock.patch.object(self, "key_value_type",
-                               KeyValueType("(P?<test>.*)")):
-            with self.assertRaises(ValueError) as e:
-                self.key_value_type("a")
-                self.assertIn("needs a 'key' and 'value' named capturing group")
+    def test_invalid_pattern(self):
+        # patterns get validated once on initialization
+        with self.assertRaises(ValueError) as e:
+            KeyValueType("(P?<test>.*)")
+        self.assertIn("needs a 'key' and 'value' named capturing group", str(e.exception))
+        with self.assertRaises(ValueError):
+            KeyValueType("(?P<key>.*)")
+        with self.assertRaises(ValueError):
+            KeyValueType("(?P<key>\w)(?P<value>\d)", prefix_pattern="(?P<prefix>\w)")
 
     def test_call_with_prefix_pattern(self):
         with mock.patch.object(self, "key_value_type",
@@ -64,6 +96,13 @@ class TestKeyValueType(TestCase):
                                             prefix_pattern="(?P<key>[a-z]+):")):
             self.assertDictEqual({'testfoo': 1, 'testbar': 2},
                                  self.key_value_type("test: 1 foo, 2 bar"))
+            self.assertDictEqual({"test: foo": ""}, self.key_value_type("test: foo"))
+            with self.assertRaises(ValueError):
+                self.key_value_type("1 foo")
+
+    def test_convert_many(self):
+        key_value_type = KeyValueType("(?P<key>[a-z])+\=(?P<value>\d+)$", value_type=int)
+        self.assertListEqual([{"a": 1}, {"b": 2}], key_value_type.convert_many(["a=1", "b=2"]))
 
 
 class TestTimeType(TestCase):
@@ -80,6 +119,13 @@ class TestTimeType(TestCase):
             self.assertEqual(time(5, 6, 3, 0), self.time_type("5:6:3:00000"))
             self.assertEqual(time(5, 6, 3, 1), self.time_type("5:6:3:1"))
             self.assertEqual("24:2:1", self.time_type("24:2:1"))
+            self.assertEqual(time(5, 6, 3), self.time_type("5:6:3\n"))
+            for invalid in ["5:6", "5:6:3:1:2", "5:6:3:1234567", "123:6:3", "5::3", "5:a:3", " 5:6:3", "5:6:3 "]:
+                self.assertEqual(invalid, self.time_type(invalid))
+
+    def test_convert_many(self):
+        self.assertListEqual([time(5, 6, 3), "foo", time(23, 59, 59, 10)],
+                             TimeType().convert_many(["5:6:3", "foo", "23:59:59:10"]))
 
 
 class TestTwoDimensionalNumberArrayType(TestCase):
@@ -95,3 +141,21 @@ class TestTwoDimensionalNumberArrayType(TestCase):
         with mock.patch.object(self, "array_type",
                             TwoDimensionalNumberArrayType("(?P<number>-?\d+(\.\d+)?)", item_array_size=3)):
             self.assertEqual([[1.0, -2.0 , 3.0], [-6.0]], self.array_type("(1, -2, 3) >> (-6.0)"))
+
+    @skipIf(logmole_types.numpy is None, "numpy is not available")
+    def test_call_as_array(self):
+        with mock.patch.object(self, "array_type",
+                               TwoDimensionalNumberArrayType("(?P<number>-?\d+(\.\d+)?)", item_array_size=3,
+                                                             as_array=True)):
+            result = self.array_type("(1, -2, 3) >> (-6.5, 0, 2.25)")
+            self.assertIsInstance(result, logmole_types.numpy.ndarray)
+            self.assertTupleEqual(result.shape, (2, 3))
+            self.assertEqual([[1.0, -2.0, 3.0], [-6.5, 0.0, 2.25]], result.tolist())
+            # uneven items and no matches
+            self.assertEqual([[1.0, -2.0, 3.0], [-6.0]], self.array_type("(1, -2, 3) >> (-6)"))
+            self.assertEqual("foo", self.array_type("foo"))
+
+    def test_call_as_array_fallback(self):
+        with mock.patch.object(logmole_types, "numpy", None):
+            array_type = TwoDimensionalNumberArrayType("(?P<number>-?\d+)", item_array_size=2, as_array=True)
+            self.assertEqual([[1.0, 2.0], [3.0, 4.0]], array_type("1 2 3 4"))